@@ -1,9 +1,23 @@
 import logging
-import os
 import re
-from pathlib import Path
+from functools import cached_property
 
-from crewai import Agent, Crew, Process, Task
+# crewai (e response_cache, que depende dele) é importado dentro dos métodos que o utilizam:
+# carregar este módulo para inspecionar configurações não paga o custo de importar o CrewAI.
+
+__all__ = ['RevisorArtigosSl3V1Crew']
+
+# Placeholders que não são fornecidos na etapa de criação do artigo
+_PLACEHOLDERS_CRIADOR_RE = re.compile(r'\{solicitacoes\}')
+
+# Etapas do pipeline, na ordem de execução:
+# (tarefa no tasks.yaml, agente responsável, tarefas usadas como contexto, formato de saída)
+PIPELINE = (
+    ('leitura_pdfs', 'leitor', (), 'YAML'),
+    ('revisao_yaml', 'revisor', ('leitura_pdfs',), 'YAML'),
+    ('pesquisa_informacoes', 'agente_pesquisa', ('revisao_yaml',), 'TEXT'),
+    ('criar_artigo_linkedin', 'criador_artigos', ('revisao_yaml', 'pesquisa_informacoes'), 'markdown'),
+)
 
 
 class RevisorArtigosSl3V1Crew:
@@ -15,7 +29,8 @@ class RevisorArtigosSl3V1Crew:
     A classe é configurada com agentes e tarefas definidos nos arquivos YAML de configuração.
     """
 
-    def __init__(self, agents_config=None, tasks_config=None, llm=None, pdf_tool=None, serper_tool=None):
+    def __init__(self, agents_config=None, tasks_config=None, llm=None, pdf_tool=None, serper_tool=None,
+                 pdf_page_tool=None, tool_cache_path=None, verbose=None):
         """
         Inicializa a equipe com as configurações necessárias.
 
@@ -25,6 +40,13 @@ class RevisorArtigosSl3V1Crew:
             llm: Modelo de linguagem a ser usado pelos agentes.
             pdf_tool: Ferramenta para leitura de PDFs, utilizada pelo agente Leitor.
             serper_tool: Ferramenta para buscar informações adicionais, utilizada pelo agente Criador de Artigos.
+            pdf_page_tool (opcional): Ferramenta de leitura por intervalos de páginas, utilizada
+                pelo agente Leitor junto com pdf_tool.
+            tool_cache_path (str, opcional): Caminho do banco SQLite usado como cache de
+                resultados das ferramentas, compartilhado entre processos. Se None, utiliza o
+                cache em memória padrão do CrewAI.
+            verbose (bool, opcional): Ativa a saída detalhada do CrewAI (cada passo dos
+                agentes). Se None, é ativada apenas quando o logging está em nível DEBUG.
 
         Atributos:
             agents_config (dict): Armazena as configurações dos agentes.
@@ -32,12 +54,88 @@ class RevisorArtigosSl3V1Crew:
             llm: Instância do modelo de linguagem a ser usada pelos agentes.
             pdf_tool: Instância da ferramenta de leitura de PDFs.
             serper_tool: Instância da ferramenta para buscar informações adicionais.
+            pdf_page_tool: Instância da ferramenta de leitura por páginas.
+            tool_cache_path (str): Caminho do cache persistente de ferramentas.
+            verbose (bool): Saída detalhada da equipe e dos agentes.
+
+        Raises:
+            ValueError: Se tasks_config for informado com tarefas do pipeline incompletas.
         """
         self.agents_config = agents_config or {}
         self.tasks_config = tasks_config or {}
         self.llm = llm
         self.pdf_tool = pdf_tool
         self.serper_tool = serper_tool
+        self.pdf_page_tool = pdf_page_tool
+        self.tool_cache_path = tool_cache_path
+        self.verbose = logging.getLogger().isEnabledFor(logging.DEBUG) if verbose is None else verbose
+
+        # Listas de ferramentas montadas uma única vez e reutilizadas pelos agentes
+        self._pdf_tools = [tool for tool in (pdf_tool, pdf_page_tool) if tool]
+        self._serper_tools = [serper_tool] if serper_tool else []
+
+        # Especificações das tarefas, extraídas e validadas uma única vez
+        self._task_specs = self._preparar_task_specs()
+
+        # Registrar fragmentos estáticos (template, solicitações...) para cache de prompt
+        self.fragmentos_estaticos = self._mapear_fragmentos_estaticos()
+        if hasattr(self.llm, 'registrar_fragmentos'):
+            self.llm.registrar_fragmentos(self.fragmentos_estaticos)
+
+    def _preparar_task_specs(self):
+        """
+        Extrai description e expected_output de cada tarefa do pipeline.
+
+        Quando tasks_config é informado, todas as tarefas do PIPELINE devem ter description
+        e expected_output preenchidos: uma tarefa vazia consumiria uma chamada ao LLM
+        sem produzir resultado útil.
+
+        Returns:
+            dict: Mapeia o nome da tarefa para a tupla (description, expected_output).
+
+        Raises:
+            ValueError: Se alguma tarefa do pipeline estiver ausente ou incompleta.
+        """
+        specs = {}
+        invalidas = []
+
+        for task_name, _, _, _ in PIPELINE:
+            task_config = self.tasks_config.get(task_name) or {}
+            specs[task_name] = (task_config.get('description', ''), task_config.get('expected_output', ''))
+            if not all(specs[task_name]):
+                invalidas.append(task_name)
+
+        if self.tasks_config and invalidas:
+            raise ValueError(f"Configuração inválida para as tarefas: {', '.join(invalidas)}. "
+                             "Certifique-se de que 'description' e 'expected_output' estão definidos.")
+
+        return specs
+
+    def _mapear_fragmentos_estaticos(self):
+        """
+        Identifica os blocos delimitados por tags (ex.: <template>...</template>) nas tarefas.
+
+        Esses blocos vêm do tasks.yaml, são interpolados nos prompts dos agentes e não mudam
+        entre chamadas. Registrá-los permite que o LLM marque o fim de cada um como ponto de
+        cache, reaproveitando o prefixo mesmo quando o conteúdo seguinte varia.
+
+        Returns:
+            dict: Mapeia o nome da tag para seu delimitador de fechamento (ex.: '</template>').
+        """
+        fragmentos = {}
+
+        for task_config in self.tasks_config.values():
+            if not isinstance(task_config, dict):
+                continue
+
+            textos = [task_config.get('description', '')]
+            textos.extend(v for v in task_config.get('inputs', {}).values() if isinstance(v, str))
+
+            for texto in textos:
+                for tag in re.findall(r'<(\w+)>.*?</\1>', texto or '', flags=re.DOTALL):
+                    fragmentos[tag] = f'</{tag}>'
+
+        return fragmentos
 
     def _create_leitor_pdfs(self):
         """
@@ -49,16 +147,18 @@ class RevisorArtigosSl3V1Crew:
         Returns:
             Agent: Instância do agente configurado para leitura de PDFs.
         """
+        from crewai import Agent
+
         agent_config = self.agents_config.get('leitor_pdfs', {})
 
         return Agent(
             role=agent_config.get('role'),
             goal=agent_config.get('goal'),
             backstory=agent_config.get('backstory'),
-            tools=[self.pdf_tool] if self.pdf_tool else [],
+            tools=self._pdf_tools,
             llm=self.llm,
-            verbose=True,
-            memory=True
+            verbose=self.verbose,
+            memory=False
         )
 
     def _create_revisor_yaml(self):
@@ -71,6 +171,8 @@ class RevisorArtigosSl3V1Crew:
         Returns:
             Agent: Instância do agente configurado para revisão de YAML.
         """
+        from crewai import Agent
+
         agent_config = self.agents_config.get('revisor_yaml', {})
 
         return Agent(
@@ -78,7 +180,7 @@ class RevisorArtigosSl3V1Crew:
             goal=agent_config.get('goal'),
             backstory=agent_config.get('backstory'),
             llm=self.llm,
-            verbose=True
+            verbose=self.verbose
         )
 
     def _create_agente_pesquisa(self):
@@ -94,6 +196,8 @@ class RevisorArtigosSl3V1Crew:
         Raises:
             ValueError: Se qualquer configuração obrigatória estiver ausente ou inválida.
         """
+        from crewai import Agent
+
         agent_config = self.agents_config.get('agente_pesquisa', {})
 
         # Validação das configurações
@@ -109,10 +213,10 @@ class RevisorArtigosSl3V1Crew:
             role=role,
             goal=goal,
             backstory=backstory,
-            tools=[self.serper_tool] if self.serper_tool else [],
+            tools=self._serper_tools,
             llm=self.llm,
-            verbose=True,
-            memory=True
+            verbose=self.verbose,
+            memory=False
         )
 
     def _create_criador_artigos(self):
@@ -145,29 +249,83 @@ class RevisorArtigosSl3V1Crew:
             >>> print(f"Agente criado com role: {criador.role}")
             Agente criado com role: Criador de Artigos LinkedIn
         """
-        agent_config = self.agents_config.get('criador_artigos_linkedin', {})
+        from crewai import Agent
 
-        # Sanitizar o goal para remover dependências de variáveis não fornecidas
-        goal = agent_config.get('goal', '')
-        if '{solicitacoes}' in goal:
-            goal = goal.replace('{solicitacoes}', '')
+        agent_config = self.agents_config.get('criador_artigos_linkedin', {})
 
         # Validar configurações essenciais
         if not agent_config.get('role'):
             raise KeyError("Role não definido para o Criador de Artigos LinkedIn")
 
-        if not goal.strip():
-            raise ValueError("Goal inválido após sanitização")
-
         return Agent(
             role=agent_config.get('role'),
-            goal=goal,
+            goal=self._goal_criador_artigos,
             backstory=agent_config.get('backstory'),
             llm=self.llm,
-            verbose=True
+            verbose=self.verbose
         )
 
-    def create_crew(self, output_file_artigo: str):
+    @cached_property
+    def _goal_criador_artigos(self):
+        """
+        Goal do Criador de Artigos, sanitizado uma única vez por instância.
+
+        Remove a dependência da variável {solicitacoes}, que não é fornecida
+        na etapa de criação do artigo.
+
+        Raises:
+            ValueError: Se o goal ficar vazio após a sanitização.
+        """
+        goal = self.agents_config.get('criador_artigos_linkedin', {}).get('goal', '')
+        goal = _PLACEHOLDERS_CRIADOR_RE.sub('', goal)
+
+        if not goal.strip():
+            raise ValueError("Goal inválido após sanitização")
+
+        return goal
+
+    def rebind_pdf(self, pdf_tool, pdf_page_tool=None):
+        """
+        Troca as ferramentas de leitura para processar outro PDF com a mesma instância.
+
+        Apenas o agente Leitor depende do PDF; os demais agentes, o LLM e a ferramenta
+        de pesquisa continuam sendo reaproveitados. O próprio Leitor também é mantido:
+        só sua lista de ferramentas é substituída (as tarefas copiam as ferramentas do
+        agente ao serem criadas em create_crew).
+
+        Args:
+            pdf_tool: Ferramenta de leitura do novo PDF.
+            pdf_page_tool (opcional): Ferramenta de leitura por páginas do novo PDF.
+        """
+        self.pdf_tool = pdf_tool
+        self.pdf_page_tool = pdf_page_tool
+        self._pdf_tools = [tool for tool in (pdf_tool, pdf_page_tool) if tool]
+
+        # Atualizar o Leitor memorizado, se já existir, sem reconstruí-lo
+        if 'leitor' in self.__dict__:
+            self.leitor.tools = list(self._pdf_tools)
+
+    @cached_property
+    def leitor(self):
+        """Agente Leitor de PDFs, criado na primeira utilização e reaproveitado."""
+        return self._create_leitor_pdfs()
+
+    @cached_property
+    def revisor(self):
+        """Agente Revisor de YAML, criado na primeira utilização e reaproveitado."""
+        return self._create_revisor_yaml()
+
+    @cached_property
+    def agente_pesquisa(self):
+        """Agente de Pesquisa, criado na primeira utilização e reaproveitado."""
+        return self._create_agente_pesquisa()
+
+    @cached_property
+    def criador_artigos(self):
+        """Agente Criador de Artigos LinkedIn, criado na primeira utilização e reaproveitado."""
+        return self._create_criador_artigos()
+
+    def create_crew(self, output_file_artigo: str, cache_namespace=None):
         """
             Cria e retorna a equipe configurada usando as definições dos YAMLs.
 
@@ -185,6 +343,15 @@ class RevisorArtigosSl3V1Crew:
             O salvamento dos arquivos é gerenciado centralmente pela função save_article(),
             que garante a consistência na nomeação e localização dos arquivos gerados.
 
+            Os agentes são criados uma única vez por instância e reaproveitados entre chamadas.
+            Por isso uma mesma instância não deve montar equipes executadas em paralelo: elas
+            compartilhariam os objetos Agent.
+
+            Args:
+                output_file_artigo (str): Caminho do arquivo Markdown do artigo.
+                cache_namespace (str, opcional): Identifica o documento no cache de ferramentas
+                    (ex.: hash do PDF). Se omitido, utiliza output_file_artigo.
+
             Returns:
                 Crew: Instância da equipe configurada com todos os agentes e tarefas necessários
                       para o processamento completo dos artigos.
@@ -199,60 +366,60 @@ class RevisorArtigosSl3V1Crew:
                 >>> results = crew.kickoff(inputs=inputs)
         """
 
-        # Criar os agentes
-        leitor = self._create_leitor_pdfs()
-        revisor = self._create_revisor_yaml()
-        agente_pesquisa = self._create_agente_pesquisa()
-        criador_artigos = self._create_criador_artigos()
-
-        # Obter configurações de cada tarefa
-        leitura_config = self.tasks_config.get('leitura_pdfs', {})
-        revisao_config = self.tasks_config.get('revisao_yaml', {})
-        pesquisa_config = self.tasks_config.get('pesquisa_informacoes', {})
-        criar_artigo_config = self.tasks_config.get('criar_artigo_linkedin', {})
-
-        # Tarefa de leitura com output_file especificado
-        leitura = Task(
-            description=leitura_config.get('description', ''),
-            expected_output=leitura_config.get('expected_output', ''),
-            agent=leitor,
-            output_format="YAML",  # Especifica formato de saída
-        )
-
-        # Tarefa de revisão com output_file especificado
-        revisao = Task(
-            description=revisao_config.get('description', ''),
-            expected_output=revisao_config.get('expected_output', ''),
-            agent=revisor,
-            context=[leitura],
-            output_format="YAML"  # Especifica formato de saída
-        )
-
-        # Tarefa de pesquisa adicional
-        pesquisa = Task(
-            description=pesquisa_config.get('description', ''),
-            expected_output=pesquisa_config.get('expected_output', ''),
-            agent=agente_pesquisa,
-            context=[revisao],
-            output_format="TEXT"
-        )
-
-        # Tarefa de criação de artigo no LinkedIn
-        criar_artigo = Task(
-            description=criar_artigo_config.get('description', ''),
-            expected_output=criar_artigo_config.get('expected_output', ''),
-            agent=criador_artigos,
-            context=[revisao, pesquisa],
-            output_format="markdown",  # Especifica formato de saída
-            output_file=output_file_artigo  # Recebe o nome do arquivo dos inputs
-        )
-
-        # Criar e retornar a equipe com configurações adicionais
-        return Crew(
-            agents=[leitor, revisor, agente_pesquisa, criador_artigos],
-            tasks=[leitura, revisao, pesquisa, criar_artigo],
+        # Obter os agentes (criados na primeira utilização e reaproveitados)
+        leitor = self.leitor
+        revisor = self.revisor
+        agente_pesquisa = self.agente_pesquisa
+        criador_artigos = self.criador_artigos
+
+        from crewai import Crew, Process, Task
+
+        from revisor_artigos_sl3v1.response_cache import SQLiteCacheHandler
+
+        agentes = {
+            'leitor': leitor,
+            'revisor': revisor,
+            'agente_pesquisa': agente_pesquisa,
+            'criador_artigos': criador_artigos,
+        }
+
+        # Criar as tarefas a partir da definição declarativa do pipeline
+        tarefas = {}
+        for task_name, agent_name, context_names, output_format in PIPELINE:
+            description, expected_output = self._task_specs[task_name]
+            task_kwargs = {}
+            if task_name == 'criar_artigo_linkedin':
+                task_kwargs['output_file'] = output_file_artigo  # Recebe o nome do arquivo dos inputs
+
+            tarefas[task_name] = Task(
+                name=task_name,  # Identifica o output (TaskOutput.name) sem comparar roles
+                description=description,
+                expected_output=expected_output,
+                agent=agentes[agent_name],
+                context=[tarefas[name] for name in context_names] or None,
+                output_format=output_format,  # Especifica formato de saída
+                **task_kwargs
+            )
+
+        # Criar a equipe com configurações adicionais
+        crew = Crew(
+            agents=list(agentes.values()),
+            tasks=list(tarefas.values()),
             process=Process.sequential,
-            verbose=True,
+            verbose=self.verbose,
             full_output=True,  # Retorna todos os outputs intermediários
-            cache=True  # Habilita cache para melhor performance
+            cache=True,  # Habilita cache para melhor performance
+            memory=False  # Memórias recuperadas variam por chamada e invalidariam o cache de prompt
         )
+
+        # Substituir o cache em memória por um cache persistente, isolado por documento. O
+        # Crew só repassa seu cache aos agentes na construção; depois disso as ferramentas
+        # consultam o cache de cada agente, trocado pela API pública set_cache_handler
+        if self.tool_cache_path:
+            cache_handler = SQLiteCacheHandler(
+                path=str(self.tool_cache_path), namespace=cache_namespace or output_file_artigo
+            )
+            for agent in crew.agents:
+                agent.set_cache_handler(cache_handler)
+
+        return crew
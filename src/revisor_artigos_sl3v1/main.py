@@ -15,22 +15,74 @@ src/revisor_artigos_sl3v1/
 Author: [Samuel Levi Araújo Alves]
 Date: 2024-10-27
 """
+import atexit
+import copy
+import hashlib
+import json
 import logging
+import logging.handlers
+import multiprocessing
 # Importações necessárias para o funcionamento do script
 import os
 import re
+import secrets
+import stat
 import sys
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime as dt
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, TypedDict
 
 import yaml
-from crewai import LLM
-from crewai_tools import PDFSearchTool, SerperDevTool
 from dotenv import load_dotenv
 
 from revisor_artigos_sl3v1.crew import RevisorArtigosSl3V1Crew
 
+# crewai_tools, response_cache e as ferramentas (que dependem do CrewAI) são importados
+# dentro das funções do processamento de PDFs: quando não há PDFs pendentes ou só os
+# artigos são gerados a partir dos YAMLs, o CrewAI não chega a ser importado.
+if TYPE_CHECKING:
+    from crewai_tools import PDFSearchTool
+
+    from revisor_artigos_sl3v1.response_cache import CachedLLM
+
+# Utilizar o loader e o dumper em C (libyaml) quando disponíveis. YAML_ENGINE=python
+# força a implementação em Python puro (ex.: para comparar saídas ou contornar um
+# problema da libyaml instalada). O motor escolhido é registrado por setup_logging: um
+# logging.debug aqui configuraria o logger raiz antes dela.
+YAML_EM_C = yaml.__with_libyaml__ and os.getenv('YAML_ENGINE', 'c').lower() != 'python'
+SafeDumper = yaml.CSafeDumper if YAML_EM_C else yaml.SafeDumper
+SafeLoader = yaml.CSafeLoader if YAML_EM_C else yaml.SafeLoader
+
+
+class _DumperSemAliases(SafeDumper):
+    """
+    Dumper que não rastreia objetos repetidos.
+
+    Os dados gravados vêm de YAML recém-parseado e não têm referências compartilhadas
+    que justifiquem âncoras; ignorar aliases dispensa o registro de cada nó
+    representado e evita saídas com &id001/*id001.
+    """
+
+    def ignore_aliases(self, data) -> bool:
+        return True
+
+# Serialização JSON dos dados intermediários: orjson quando disponível
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj, default=str).decode('utf-8')
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False, default=str)
+
+    _json_loads = json.loads
+
 # Configurar a saída do terminal para UTF-8
 sys.stdout.reconfigure(encoding='utf-8')
 
@@ -38,13 +90,116 @@ sys.stdout.reconfigure(encoding='utf-8')
 load_dotenv()
 os.environ['OPENAI_API_KEY'] = os.getenv("OPENAI_API_KEY")
 
+# Número máximo de PDFs processados simultaneamente. O tempo de cada PDF é dominado
+# pela espera das chamadas ao modelo, então o limite acompanha o rate limit da API
+# e não o número de CPUs. Pode ser ajustado pela variável de ambiente CREW_CONCURRENCY,
+# lida em processar_pdfs (ver _max_workers_pdfs).
+MAX_WORKERS_PDFS = 8
+
+# Caminhos do projeto, resolvidos uma única vez na importação do módulo
+PACKAGE_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = PACKAGE_DIR.parent.parent
+CONFIG_DIR = PACKAGE_DIR / 'config'
+RESOURCES_DIR = PACKAGE_DIR / 'resources'
+PDF_DIR = RESOURCES_DIR / 'pdfs'
+YAML_DIR = RESOURCES_DIR / 'yamls'
+ARTIGOS_MARKDOWN_DIR = RESOURCES_DIR / 'artigos_markdown'
+
+# Diretório dos arquivos de log diários (ver setup_logging)
+LOG_DIR = PROJECT_ROOT / 'logs'
+
+# Diretório dos caches persistentes (respostas do LLM, ferramentas e índices de PDFs)
+CACHE_DIR = PROJECT_ROOT / '.crew_cache'
+
+# Hash do conteúdo de cada YAML cujo artigo foi gerado por gerar_artigos_a_partir_de_yaml
+MANIFESTO_ARTIGOS = CACHE_DIR / 'artigos.json'
+
+# Tamanho máximo, em caracteres, de uma resposta do LLM tratada como YAML.
+# Respostas maiores indicam saída degenerada e são descartadas sem passar pelo parser.
+MAX_TAMANHO_YAML = 2_000_000
+
+# Marcador do template de leitura substituído pelo nome de cada PDF
+MARCADOR_ARQUIVO_TEMPLATE = 'nome do arquivo.pdf'
+
+# Tarefa do pipeline (ver crew.PIPELINE) de cada agente, pelo trecho do seu role. Usado
+# apenas para outputs sem o nome da tarefa; os da equipe trazem TaskOutput.name
+TAREFAS_POR_AGENTE = (
+    ('Leitor de PDFs', 'leitura_pdfs'),
+    ('Revisor', 'revisao_yaml'),
+    ('Pesquisa', 'pesquisa_informacoes'),
+    ('Criador de Artigos', 'criar_artigo_linkedin'),
+)
+
+# Substituições caractere a caractere usam str.translate, que percorre o texto em C
+# sem passar pelo motor de regex; laços em Python sobre caracteres devem ser evitados
+_NOME_INVALIDO_TABELA = str.maketrans(dict.fromkeys('\\/*?:"<>|\n', '_'))
+
+# Expressões regulares usadas a cada PDF/arquivo, compiladas uma única vez
+_NOME_PDF_INVALIDO_RE = re.compile(r'[^\w\-]')
+# Cercas ```yaml (com os espaços seguintes) e quaisquer crases, removidas em uma única passada
+_CERCAS_YAML_RE = re.compile(r'```+\s*yaml\s*|`+')
+# Cercas ```markdown (com os espaços seguintes) e demais cercas, também em uma única passada
+_CERCAS_MARKDOWN_RE = re.compile(r'```+\s*markdown\s*|```+')
+# Espaços no fim da linha e linhas em branco até a quebra seguinte (mesmas quebras de str.splitlines)
+_QUEBRAS_EM_BRANCO_RE = re.compile(r'\s*[\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]')
+_NOME_ARTIGO_INVALIDO_RE = re.compile(r'[^\w\-\.]')
+_SUBLINHADOS_RE = re.compile(r'_+')
+
+# Seções do YAML incluídas no artigo para o LinkedIn, na ordem de apresentação
+SECOES_ARTIGO = (
+    ('GAP', '🎯 Por que isso importa?'),
+    ('OBJETIVOS', '💡 O que descobrimos?'),
+    ('METODOLOGIA', '🔍 Como chegamos lá?'),
+    ('RESULTADOS', '📊 O que encontramos?'),
+    ('LIMITAÇÕES', '⚠️ Quais são os desafios?'),
+    ('FUTURO', '🔮 O que vem a seguir?'),
+)
+
+# Partes fixas do artigo para o LinkedIn: cabeçalho (recebe o nome do PDF) e
+# call-to-action com hashtags
+CABECALHO_ARTIGO = "🔬 #CiênciaNaPrática\n\n# {pdf_file_name}\n\n---\n"
+RODAPE_ARTIGO = (
+    "\n\n## 💭 E você, o que acha?\n\n"
+    "Como essas descobertas podem impactar sua área? Compartilhe suas ideias! 👇\n\n"
+    "\n---\n\n"
+    "#IA #Pesquisa #Inovação #Tecnologia #Desenvolvimento #Ciência"
+)
+
+# Diretórios de saída, criados uma única vez por setup_directories em vez de a cada gravação
+DIRETORIOS_SAIDA = (ARTIGOS_MARKDOWN_DIR, CACHE_DIR / 'yamls', CACHE_DIR / 'config')
+
+
+class ArtigoYAML(TypedDict):
+    """Estrutura dos YAMLs de análise: a chave ARTIGO com a lista (ou dict) de seções."""
+
+    ARTIGO: Any
+
+
+def eh_artigo_yaml(dados: Any) -> bool:
+    """
+    Verifica se o YAML interpretado tem a estrutura de ArtigoYAML.
+
+    O SafeLoader produz dict puro, então a comparação direta da classe basta e
+    substitui as checagens sucessivas de valor vazio, isinstance e chave.
+
+    Args:
+        dados: Resultado do parse do YAML.
+
+    Returns:
+        bool: True se for um dict com a chave ARTIGO.
+    """
+    return dados.__class__ is dict and 'ARTIGO' in dados
+
 
 def setup_directories() -> None:
     """
-    Verifica a estrutura de diretórios do projeto.
+    Cria os diretórios de saída e verifica a estrutura de diretórios do projeto.
 
-    Verifica a existência dos diretórios necessários usando caminhos absolutos:
+    Os diretórios de saída (DIRETORIOS_SAIDA) são criados se ainda não existirem;
+    os de entrada (PDFs e YAMLs) apenas são verificados, usando caminhos absolutos:
     {PROJECT_ROOT}/src/revisor_artigos_sl3v1/resources/{pdfs,yamls,artigos_markdown}
+    A verificação é a mesma de verificar_estrutura_diretorios e é feita uma única
+    vez por processo.
 
     Raises:
         FileNotFoundError: Se os diretórios não existirem
@@ -54,34 +209,12 @@ def setup_directories() -> None:
         >>> setup_directories()
         Estrutura de diretórios verificada em: .../src/revisor_artigos_sl3v1/resources
     """
-    try:
-        # Obter caminho absoluto do projeto
-        project_root = Path(__file__).resolve().parent.parent.parent  # Sobe até a raiz do projeto
-        base_dir = project_root / 'src' / 'revisor_artigos_sl3v1' / 'resources'
-
-        if not base_dir.exists():
-            raise FileNotFoundError(f"Diretório base não encontrado: {base_dir}")
-
-        directories = ['pdfs', 'yamls', 'artigos_markdown']
-
-        for dir_name in directories:
-            dir_path = base_dir / dir_name
-
-            if not dir_path.exists():
-                raise FileNotFoundError(f"Diretório não encontrado: {dir_path}")
-
-            if not os.access(dir_path, os.R_OK | os.W_OK):
-                raise PermissionError(f"Sem permissões adequadas para: {dir_path}")
-
-            logging.info(f"Diretório verificado: {dir_path}")
-
-        logging.info(f"Estrutura de diretórios validada em: {base_dir}")
-
-    except Exception as e:
-        logging.error(f"Erro ao verificar diretórios: {e}", exc_info=True)
-        raise
+    for diretorio in DIRETORIOS_SAIDA:
+        diretorio.mkdir(parents=True, exist_ok=True)
+    verificar_estrutura_diretorios()
 
 
+@lru_cache(maxsize=1)
 def verificar_estrutura_diretorios() -> Tuple[Path, Path, Path]:
     """
     Verifica e retorna os caminhos corretos dos diretórios do projeto.
@@ -89,6 +222,10 @@ def verificar_estrutura_diretorios() -> Tuple[Path, Path, Path]:
     Utiliza caminhos absolutos para garantir a localização correta dos diretórios:
     {PROJECT_ROOT}/src/revisor_artigos_sl3v1/resources/{pdfs,yamls,artigos_markdown}
 
+    O resultado é memorizado: os caminhos são constantes do módulo, então as chamadas
+    seguintes não repetem as verificações no sistema de arquivos. Falhas não são
+    memorizadas e a verificação é refeita na próxima chamada.
+
     Returns:
         Tuple[Path, Path, Path]: Tupla contendo (pdf_dir, yaml_dir, base_dir)
             - pdf_dir: Diretório de PDFs fonte
@@ -104,35 +241,321 @@ def verificar_estrutura_diretorios() -> Tuple[Path, Path, Path]:
         >>> print(f"PDFs serão lidos de: {pdf_dir}")
     """
     try:
-        # Obter caminho absoluto do diretório src/revisor_artigos_sl3v1/resources
-        project_root = Path(__file__).resolve().parent.parent.parent  # Sobe até a raiz do projeto
-        base_dir = project_root / 'src' / 'revisor_artigos_sl3v1' / 'resources'
-
-        pdf_dir = base_dir / 'pdfs'
-        yaml_dir = base_dir / 'yamls'
-        artigos_dir = base_dir / 'artigos_markdown'
-
-        # Verificar se os diretórios existem
-        for dir_path in [base_dir, pdf_dir, yaml_dir, artigos_dir]:
-            if not dir_path.exists():
-                logging.error(f"Diretório não encontrado: {dir_path}")
+        base_dir = RESOURCES_DIR
+        pdf_dir = PDF_DIR
+        yaml_dir = YAML_DIR
+        artigos_dir = ARTIGOS_MARKDOWN_DIR
+
+        # Verificar se os diretórios existem: uma única listagem do diretório base
+        if not base_dir.is_dir():
+            logging.error("Diretório não encontrado: %s", base_dir)
+            raise FileNotFoundError(f"Diretório não encontrado: {base_dir}")
+
+        with os.scandir(base_dir) as entradas:
+            subdiretorios = {entrada.name for entrada in entradas if entrada.is_dir()}
+
+        for dir_path in (pdf_dir, yaml_dir, artigos_dir):
+            if dir_path.name not in subdiretorios:
+                logging.error("Diretório não encontrado: %s", dir_path)
                 raise FileNotFoundError(f"Diretório não encontrado: {dir_path}")
 
+        for dir_path in (base_dir, pdf_dir, yaml_dir, artigos_dir):
             if not os.access(dir_path, os.R_OK | os.W_OK):
                 raise PermissionError(f"Sem permissões adequadas para: {dir_path}")
 
-        logging.info(f"Estrutura de diretórios verificada:")
-        logging.info(f"- Base: {base_dir}")
-        logging.info(f"- PDFs: {pdf_dir}")
-        logging.info(f"- YAMLs: {yaml_dir}")
+        logging.info("Estrutura de diretórios verificada:")
+        logging.info("- Base: %s", base_dir)
+        logging.info("- PDFs: %s", pdf_dir)
+        logging.info("- YAMLs: %s", yaml_dir)
 
         return pdf_dir, yaml_dir, base_dir
 
     except Exception as e:
-        logging.error(f"Erro ao verificar estrutura de diretórios: {e}", exc_info=True)
+        logging.error("Erro ao verificar estrutura de diretórios: %s", e, exc_info=True)
+        raise
+
+
+@contextmanager
+def _arquivo_atomico(file_path: Path, binario: bool = False, duravel: bool = False):
+    """
+    Abre um arquivo temporário que substitui file_path ao final do bloco with.
+
+    Se o bloco levantar uma exceção, o temporário é removido e o destino permanece intacto.
+    Com binario=True o arquivo é aberto em modo binário, para quem já tem os bytes prontos.
+    Com duravel=True o temporário é sincronizado em disco (fsync) antes da troca, de modo
+    que nem uma queda do sistema deixa o destino vazio.
+
+    O temporário é criado com 0666, como em um open() comum, e o kernel aplica a umask;
+    se o destino já existe, o temporário recebe as permissões dele antes da troca.
+    """
+    file_path = Path(file_path)
+    while True:
+        tmp_path = file_path.parent / f'.{file_path.name}.{secrets.token_hex(4)}.tmp'
+        try:
+            fd = os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0),
+                         0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(file_path).st_mode))
+        except FileNotFoundError:
+            pass
+        if binario:
+            file = open(fd, 'wb')
+        else:
+            file = open(fd, 'w', encoding='utf-8', buffering=64 * 1024)
+        with file:
+            yield file
+            if duravel:
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
         raise
 
 
+def escrever_arquivo_atomico(file_path: Path, content: str) -> None:
+    """
+    Grava um arquivo de texto de forma atômica.
+
+    O conteúdo é codificado em UTF-8 uma única vez e gravado em bytes em um arquivo
+    temporário no mesmo diretório, que depois é renomeado sobre o destino com os.replace.
+    Uma interrupção no meio da escrita nunca deixa o arquivo final truncado, e escritas
+    concorrentes no mesmo destino não se misturam.
+
+    Args:
+        file_path (Path): Caminho do arquivo de destino.
+        content (str): Conteúdo a ser gravado (UTF-8).
+
+    Raises:
+        OSError: Se houver erro ao gravar ou renomear o arquivo.
+    """
+    dados = content.encode('utf-8')
+    with _arquivo_atomico(file_path, binario=True) as file:
+        file.write(dados)
+
+
+def escrever_yaml_atomico(file_path: Path, dados, **opcoes) -> None:
+    """
+    Grava dados em YAML de forma atômica, serializando direto no arquivo.
+
+    O dumper (baseado no CSafeDumper quando disponível) escreve no arquivo temporário à medida
+    que serializa, sem montar antes o documento inteiro em uma string. O temporário é
+    sincronizado em disco antes da troca: o YAML é a entrada de gerar_artigos_a_partir_de_yaml
+    (ver _artigo_atualizado), e um arquivo vazio após uma queda seria tomado como atualizado.
+
+    Args:
+        file_path (Path): Caminho do arquivo de destino.
+        dados: Conteúdo a ser serializado.
+        **opcoes: Opções repassadas a yaml.dump (ex.: sort_keys=False).
+
+    Raises:
+        OSError: Se houver erro ao gravar ou renomear o arquivo.
+        yaml.YAMLError: Se os dados não puderem ser representados em YAML.
+    """
+    with _arquivo_atomico(file_path, duravel=True) as file:
+        yaml.dump(dados, file, Dumper=_DumperSemAliases, default_flow_style=False, allow_unicode=True,
+                  **opcoes)
+
+
+def listar_arquivos(diretorio: Path, sufixo: str, prefixo: str = '') -> list:
+    """
+    Lista os arquivos de um diretório filtrando por prefixo e sufixo do nome.
+
+    Utiliza os.scandir, que obtém o tipo de cada entrada junto com a listagem do
+    diretório, evitando uma chamada de stat por arquivo.
+
+    Args:
+        diretorio (Path): Diretório a ser listado.
+        sufixo (str): Sufixo exigido no nome do arquivo (ex.: '.pdf').
+        prefixo (str, opcional): Prefixo exigido no nome do arquivo (ex.: 'output_').
+
+    Returns:
+        list: Caminhos (Path) dos arquivos encontrados.
+
+    Example:
+        >>> listar_arquivos(yaml_dir, '.yaml', prefixo='output_')
+        [PosixPath('.../yamls/output_artigo.yaml')]
+    """
+    with os.scandir(diretorio) as entradas:
+        return [
+            Path(entrada.path) for entrada in entradas
+            if entrada.name.endswith(sufixo) and entrada.name.startswith(prefixo) and entrada.is_file()
+        ]
+
+
+@lru_cache(maxsize=128)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int):
+    """
+    Lê e interpreta um arquivo YAML, memorizando o resultado.
+
+    A chave inclui mtime e tamanho do arquivo, de modo que qualquer alteração
+    no arquivo gera uma nova leitura. O arquivo é lido em binário e a decodificação
+    fica a cargo da libyaml; só se houver bytes UTF-8 inválidos ele é relido como
+    texto, com substituição dos caracteres inválidos.
+    """
+    try:
+        with open(path, 'rb') as file:
+            return yaml.load(file, Loader=SafeLoader)
+    except yaml.reader.ReaderError:
+        with open(path, 'r', encoding='utf-8', errors='replace') as file:
+            return yaml.load(file, Loader=SafeLoader)
+
+
+def carregar_yaml(path: Path, copiar: bool = True):
+    """
+    Carrega um arquivo YAML usando o cache indexado por (caminho, mtime, tamanho).
+
+    Args:
+        path (Path): Caminho do arquivo YAML.
+        copiar (bool, opcional): Se True, retorna uma cópia que pode ser modificada sem
+            afetar o cache. Chamadores que apenas leem o conteúdo podem passar False
+            para receber o objeto em cache diretamente. Padrão: True.
+
+    Returns:
+        Conteúdo interpretado do arquivo.
+    """
+    stat = os.stat(path)
+    dados = _load_yaml_cached(str(path), stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(dados) if copiar else dados
+
+
+@lru_cache(maxsize=128)
+def _parse_yaml_bytes(conteudo: bytes):
+    """Interpreta um YAML em bytes (UTF-8), memorizando o resultado pelo próprio conteúdo."""
+    return yaml.load(conteudo, Loader=SafeLoader)
+
+
+def carregar_yaml_por_conteudo(path: Path):
+    """
+    Carrega um arquivo YAML usando o cache indexado pelo conteúdo do arquivo.
+
+    Indicado para arquivos regravados pelo pipeline (ex.: YAMLs revisados), em que
+    o conteúdo, e não o mtime, determina se o resultado anterior ainda é válido.
+
+    Args:
+        path (Path): Caminho do arquivo YAML.
+
+    Returns:
+        Cópia do conteúdo interpretado, que pode ser modificada sem afetar o cache.
+    """
+    with open(path, 'rb') as file:
+        return copy.deepcopy(_parse_yaml_bytes(file.read()))
+
+
+def caminho_json_intermediario(yaml_file: Path, categoria: str = 'yamls') -> Path:
+    """
+    Retorna o caminho da cópia em JSON de um arquivo YAML.
+
+    A cópia fica no diretório de cache, fora dos arquivos versionados, e serve
+    apenas para evitar o parser YAML ao reler o arquivo.
+
+    Args:
+        yaml_file (Path): Caminho do arquivo YAML.
+        categoria (str, opcional): Subdiretório do cache ('yamls' para os YAMLs
+            revisados, 'config' para agents.yaml e tasks.yaml). Padrão: 'yamls'.
+
+    Returns:
+        Path: Caminho do arquivo JSON correspondente.
+    """
+    return CACHE_DIR / categoria / f'{Path(yaml_file).stem}.json'
+
+
+def salvar_json_intermediario(yaml_file: Path, dados: Dict, categoria: str = 'yamls') -> None:
+    """
+    Grava a cópia em JSON dos dados de um arquivo YAML.
+
+    Deve ser chamada após a gravação do YAML, para que o JSON seja mais recente.
+    Falhas apenas são registradas no log, pois o YAML continua sendo a fonte.
+
+    Args:
+        yaml_file (Path): Caminho do arquivo YAML.
+        dados (Dict): Conteúdo já interpretado do YAML.
+        categoria (str, opcional): Subdiretório do cache. Padrão: 'yamls'.
+    """
+    json_file = caminho_json_intermediario(yaml_file, categoria)
+    try:
+        escrever_arquivo_atomico(json_file, _json_dumps(dados))
+    except (OSError, TypeError) as e:
+        logging.warning("Não foi possível salvar a cópia JSON de %s: %s", Path(yaml_file).name, e)
+
+
+def _ler_json_intermediario(yaml_file: Path, categoria: str = 'yamls'):
+    """
+    Lê a cópia em JSON de um arquivo YAML, se ela for mais recente que o YAML.
+
+    Returns:
+        Conteúdo da cópia ou None se ela não existir, estiver desatualizada ou inválida.
+    """
+    json_file = caminho_json_intermediario(yaml_file, categoria)
+    try:
+        if json_file.stat().st_mtime_ns >= Path(yaml_file).stat().st_mtime_ns:
+            with open(json_file, 'rb') as file:
+                return _json_loads(file.read())
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def carregar_dados_revisados(yaml_file: Path):
+    """
+    Carrega os dados de um YAML revisado, preferindo a cópia em JSON.
+
+    O JSON só é usado se for mais recente que o YAML; um YAML editado depois de
+    gerado pelo pipeline é sempre relido.
+
+    Args:
+        yaml_file (Path): Caminho do arquivo YAML revisado.
+
+    Returns:
+        Conteúdo interpretado do arquivo.
+    """
+    dados = _ler_json_intermediario(yaml_file)
+    if dados is not None:
+        return dados
+
+    return carregar_yaml_por_conteudo(yaml_file)
+
+
+def carregar_configuracao_yaml(path: Path):
+    """
+    Carrega um arquivo de configuração YAML, preferindo a cópia em JSON.
+
+    Na primeira leitura após uma alteração do YAML, o conteúdo é interpretado e a
+    cópia em JSON é regravada; nas execuções seguintes basta ler o JSON.
+
+    Args:
+        path (Path): Caminho do arquivo de configuração (ex.: config/agents.yaml).
+
+    Returns:
+        Conteúdo interpretado do arquivo, compartilhado com o cache (não modificar).
+    """
+    dados = _ler_json_intermediario(path, 'config')
+    if dados is None:
+        dados = carregar_yaml(path, copiar=False)
+        salvar_json_intermediario(path, dados, 'config')
+    return dados
+
+
+@lru_cache(maxsize=1)
+def _carregar_configuracoes_processo() -> Tuple[Dict, Dict]:
+    """
+    Carrega agents.yaml e tasks.yaml uma única vez por processo.
+
+    Exceções não são memorizadas: uma falha é repetida na chamada seguinte.
+    """
+    agents_config = carregar_configuracao_yaml(CONFIG_DIR / 'agents.yaml') or {}
+    logging.debug("Configurações de agents.yaml carregadas: %d agentes", len(agents_config))
+
+    tasks_config = carregar_configuracao_yaml(CONFIG_DIR / 'tasks.yaml') or {}
+    logging.debug("Configurações de tasks.yaml carregadas: %d tarefas", len(tasks_config))
+
+    return agents_config, tasks_config
+
+
 def carregar_configuracoes():
     """
     Carregar as definições de agentes e tarefas dos arquivos YAML.
@@ -141,43 +564,33 @@ def carregar_configuracoes():
     'agents.yaml' e 'tasks.yaml' localizados na pasta 'config'. Se houver algum
     erro durante o carregamento, uma mensagem será exibida.
 
+    Os arquivos são carregados uma única vez por processo; entre execuções, são
+    interpretados novamente só quando alterados, pois nas demais é lida a cópia em
+    JSON (ver carregar_configuracao_yaml). Os dicionários retornados são
+    compartilhados com o cache e não devem ser modificados.
+
     Returns:
         Tuple[Dict, Dict]: Retorna dois dicionários contendo as configurações de
         agentes e tarefas, respectivamente.
     """
-    agents_config = {}
-    tasks_config = {}
-
     try:
-        # Diretório base para localizar os arquivos de configuração
-        base_dir = Path(__file__).resolve().parent / 'config'
-        agents_file_path = base_dir / 'agents.yaml'
-        tasks_file_path = base_dir / 'tasks.yaml'
-
-        # Carregar configurações de agentes
-        with open(agents_file_path, 'r', encoding='utf-8', errors='replace') as file:
-            agents_config = yaml.safe_load(file) or {}
-            print("Configurações de agents.yaml carregadas com sucesso.")
-
-        # Carregar configurações de tarefas
-        with open(tasks_file_path, 'r', encoding='utf-8', errors='replace') as file:
-            tasks_config = yaml.safe_load(file) or {}
-            print("Configurações de tasks.yaml carregadas com sucesso.")
+        return _carregar_configuracoes_processo()
 
     except Exception as e:
-        # Exibir mensagem de erro em caso de falha no carregamento dos arquivos
-        print(f"Erro ao carregar as configurações: {e}")
-
-    return agents_config, tasks_config
+        # Registrar mensagem de erro em caso de falha no carregamento dos arquivos
+        logging.error("Erro ao carregar as configurações: %s", e)
+        return {}, {}
 
 
+@lru_cache(maxsize=256)
 def construir_caminho_artigo_markdown(pdf_path: Path) -> str:
     """
     Constrói o caminho completo do arquivo Markdown como uma string,
     com base no nome do PDF processado.
 
     Esta função sanitiza o nome do PDF e cria o caminho para o arquivo Markdown
-    dentro do diretório padrão de artigos em Markdown.
+    dentro do diretório padrão de artigos em Markdown. O resultado é memorizado
+    por caminho do PDF.
 
     Args:
         pdf_path (Path): Caminho do arquivo PDF sendo processado.
@@ -191,18 +604,17 @@ def construir_caminho_artigo_markdown(pdf_path: Path) -> str:
     Exemplo:
         >>> pdf_path = Path("src/revisor_artigos_sl3v1/resources/pdfs/Artigo_Teste.pdf")
         >>> construir_caminho_artigo_markdown(pdf_path)
-        'src/revisor_artigos_sl3v1/resources/artigos_markdown/artigo_Artigo_Teste.md'
+        '.../src/revisor_artigos_sl3v1/resources/artigos_markdown/artigo_Artigo_Teste.md'
     """
     try:
         if not pdf_path or not pdf_path.stem:
             raise ValueError("Nome do PDF está vazio ou é inválido")
 
-        # Diretório base de artigos em Markdown
-        articles_dir = Path('src/revisor_artigos_sl3v1/resources/artigos_markdown')
-        articles_dir.mkdir(parents=True, exist_ok=True)
+        # Diretório base de artigos em Markdown (criado por setup_directories)
+        articles_dir = ARTIGOS_MARKDOWN_DIR
 
         # Sanitizar o nome do arquivo PDF
-        sanitized_pdf_name = re.sub(r'[^\w\-]', '_', pdf_path.stem)
+        sanitized_pdf_name = _NOME_PDF_INVALIDO_RE.sub('_', pdf_path.stem)
 
         # Criar o caminho completo do arquivo Markdown
         markdown_file_path = articles_dir / f'artigo_{sanitized_pdf_name}.md'
@@ -211,26 +623,329 @@ def construir_caminho_artigo_markdown(pdf_path: Path) -> str:
         return str(markdown_file_path)
 
     except Exception as e:
-        logging.error(f"Erro ao construir caminho do arquivo Markdown: {e}")
+        logging.error("Erro ao construir caminho do arquivo Markdown: %s", e)
         raise
 
 
-def processar_pdfs() -> bool:
+# Equipe reaproveitada entre os PDFs processados por um mesmo worker
+_crew_worker: Optional[RevisorArtigosSl3V1Crew] = None
+
+
+def _inicializar_worker(log_queue: Optional[Any] = None) -> None:
+    """
+    Prepara um processo worker do pool de processamento de PDFs.
+
+    Os registros do worker são enviados à fila de logging do processo principal, onde um
+    único QueueListener os escreve. Sem a fila (ex.: logging não configurado), o logging
+    é configurado localmente, como em plataformas que iniciam workers com "spawn".
+
+    Args:
+        log_queue (multiprocessing.Queue, opcional): Fila criada por setup_logging.
+    """
+    root = logging.getLogger()
+
+    if log_queue is not None:
+        root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+        root.setLevel(_nivel_log())
+    elif not root.handlers:
+        setup_logging()
+
+
+def criar_llm() -> 'CachedLLM':
+    """
+    Cria o modelo de linguagem utilizado pelos agentes.
+
+    Returns:
+        CachedLLM: LLM com cache de prompt e cache persistente de respostas.
+    """
+    from revisor_artigos_sl3v1.response_cache import CachedLLM
+
+    return CachedLLM(
+        model="gpt-4o-mini",
+        api_key=os.getenv('OPENAI_API_KEY'),
+        temperature=0.7,
+        cache_dir=CACHE_DIR
+    )
+
+
+def calcular_hash_arquivo(file_path: Path) -> str:
+    """
+    Calcula o SHA-256 do conteúdo de um arquivo, lendo-o em blocos.
+
+    No Python 3.11+ usa hashlib.file_digest, que lê o arquivo direto para o buffer
+    do OpenSSL sem passar cada bloco pelo interpretador.
+
+    Args:
+        file_path (Path): Caminho do arquivo.
+
+    Returns:
+        str: Hash hexadecimal do conteúdo.
+    """
+    with open(file_path, 'rb') as file:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(file, 'sha256').hexdigest()
+
+        digest = hashlib.sha256()
+        for bloco in iter(lambda: file.read(1 << 20), b''):
+            digest.update(bloco)
+        return digest.hexdigest()
+
+
+def criar_pdf_search_tool(pdf_path: Path, pdf_hash: Optional[str] = None) -> 'PDFSearchTool':
+    """
+    Cria o PDFSearchTool com o índice vetorial persistido em disco.
+
+    O banco Chroma fica em um diretório nomeado pelo hash do conteúdo do PDF. Na
+    primeira execução o índice é construído; nas seguintes o embedchain reconhece
+    o documento já indexado e não refaz a divisão em trechos nem os embeddings.
+    Se o PDF for alterado, o hash muda e um novo índice é criado.
+
+    Args:
+        pdf_path (Path): Caminho do PDF.
+        pdf_hash (str, opcional): SHA-256 do PDF, se já calculado pelo chamador.
+
+    Returns:
+        PDFSearchTool: Ferramenta de busca semântica para o PDF.
+    """
+    from crewai_tools import PDFSearchTool
+
+    diretorio_indice = CACHE_DIR / 'pdfidx' / (pdf_hash or calcular_hash_arquivo(pdf_path))
+    return PDFSearchTool(
+        pdf=str(pdf_path),
+        config={
+            'vectordb': {
+                'provider': 'chroma',
+                'config': {'dir': str(diretorio_indice)}
+            }
+        }
+    )
+
+
+def _obter_crew_worker(agents_config: Dict, tasks_config: Dict) -> RevisorArtigosSl3V1Crew:
+    """
+    Retorna a equipe do processo atual, criando-a na primeira chamada.
+
+    O LLM, a SerperDevTool e os agentes que não dependem do PDF são construídos uma
+    única vez por worker; a cada PDF apenas as ferramentas de leitura são trocadas
+    com rebind_pdf().
+
+    Args:
+        agents_config (Dict): Configurações dos agentes.
+        tasks_config (Dict): Configurações das tarefas.
+
+    Returns:
+        RevisorArtigosSl3V1Crew: Equipe reutilizável do worker.
+    """
+    global _crew_worker
+
+    if _crew_worker is None:
+        from crewai_tools import SerperDevTool
+
+        _crew_worker = RevisorArtigosSl3V1Crew(
+            agents_config=agents_config,
+            tasks_config=tasks_config,
+            llm=criar_llm(),
+            serper_tool=SerperDevTool(),
+            tool_cache_path=CACHE_DIR / 'ferramentas.sqlite3'
+        )
+
+    return _crew_worker
+
+
+def preparar_inputs_estaticos(tasks_config: Dict) -> Tuple[Dict, Tuple[str, ...], Dict]:
+    """
+    Extrai das configurações das tarefas os inputs que não dependem do PDF.
+
+    O template de leitura é dividido uma única vez no marcador do nome do arquivo,
+    de modo que, por PDF, basta unir as partes com o nome do arquivo.
+
+    Args:
+        tasks_config (Dict): Configurações das tarefas.
+
+    Returns:
+        Tuple[Dict, Tuple[str, ...], Dict]: Inputs fixos da leitura, partes do template
+            de leitura e inputs fixos (não vazios) da criação do artigo.
+
+    Example:
+        >>> leitura_base, partes, artigo_base = preparar_inputs_estaticos(tasks_config)
+        >>> template = 'artigo.pdf'.join(partes)
+    """
+    task_config = tasks_config.get('leitura_pdfs', {}).get('inputs', {})
+    leitura_base = {
+        'solicitacoes': task_config.get('solicitacoes', ''),
+        'controles': task_config.get('controles', ''),
+        'restricoes': task_config.get('restricoes', '')
+    }
+    partes_template = tuple(task_config.get('template', '').split(MARCADOR_ARQUIVO_TEMPLATE))
+
+    task_config_artigo = tasks_config.get('criar_artigo_linkedin', {}).get('inputs', {})
+    artigo_base = {
+        'titulo': task_config_artigo.get('titulo', ''),
+        'hook': task_config_artigo.get('hook', ''),
+        'secoes': task_config_artigo.get('secoes', {}),
+        'provocacao': task_config_artigo.get('provocacao', ''),
+        'hashtags': task_config_artigo.get('hashtags', ''),
+        'controles': task_config_artigo.get('controles', ''),
+        'restricoes': task_config_artigo.get('restricoes', '')
+    }
+
+    # Remover chaves vazias
+    artigo_base = {k: v for k, v in artigo_base.items() if v}
+
+    return leitura_base, partes_template, artigo_base
+
+
+def _processar_pdf(pdf_path: Path, agents_config: Dict, tasks_config: Dict,
+                   yaml_dir: Path, markdown_dir: Path, leitura_base: Dict,
+                   partes_template: Tuple[str, ...], artigo_base: Dict) -> bool:
+    """
+    Executa o pipeline completo (leitura, revisão, pesquisa e artigo) para um único PDF.
+
+    Função de nível de módulo para poder ser enviada a um ProcessPoolExecutor.
+
+    Args:
+        pdf_path (Path): Caminho do PDF a ser processado.
+        agents_config (Dict): Configurações dos agentes.
+        tasks_config (Dict): Configurações das tarefas.
+        yaml_dir (Path): Diretório para salvar os YAMLs revisados.
+        markdown_dir (Path): Diretório dos artigos em Markdown.
+        leitura_base (Dict): Inputs fixos da leitura (ver preparar_inputs_estaticos).
+        partes_template (Tuple[str, ...]): Template de leitura dividido no nome do arquivo.
+        artigo_base (Dict): Inputs fixos da criação do artigo.
+
+    Returns:
+        bool: True se o artigo do PDF foi gerado e salvo com sucesso.
+    """
+    try:
+        # Hash do conteúdo calculado uma única vez: identifica o índice vetorial e o
+        # documento no cache de ferramentas
+        pdf_hash = calcular_hash_arquivo(pdf_path)
+        logging.info("\nProcessando: %s (sha256=%s)", pdf_path.name, pdf_hash[:12])
+
+        from revisor_artigos_sl3v1.tools.pdf_page_tool import PDFPageReaderTool
+
+        # Instanciar ferramentas. PDFs só com imagens são descartados antes de construir
+        # o índice vetorial e de qualquer chamada ao modelo
+        pdf_page_tool = PDFPageReaderTool(pdf=str(pdf_path))
+        if not pdf_page_tool.tem_texto():
+            logging.warning("%s não tem texto extraível (PDF digitalizado?); ignorado", pdf_path.name)
+            return False
+        pdf_tool = criar_pdf_search_tool(pdf_path, pdf_hash)
+
+        # Inputs de leitura: apenas o nome do arquivo varia por PDF
+        leitura_inputs = {
+            **leitura_base,
+            'arquivo': pdf_path.name,
+            'template': pdf_path.name.join(partes_template)
+        }
+
+        # Construir caminho para o arquivo de saída do artigo
+        output_file_artigo = construir_caminho_artigo_markdown(pdf_path)
+
+        # Preparar inputs para criação do artigo (chaves vazias já removidas em artigo_base)
+        artigo_inputs = {**artigo_base, 'output_file': output_file_artigo}
+
+        # Reaproveitar a equipe do worker, trocando apenas as ferramentas do PDF
+        crew_instance = _obter_crew_worker(agents_config, tasks_config)
+        crew_instance.rebind_pdf(pdf_tool, pdf_page_tool)
+        crew = crew_instance.create_crew(output_file_artigo=output_file_artigo, cache_namespace=pdf_hash)
+
+        # Executar tarefa de leitura
+        results = crew.kickoff(inputs=leitura_inputs)
+        if results and hasattr(results, 'tasks_output'):
+            saidas = indexar_saidas_por_tarefa(results.tasks_output)
+            yaml_content = processar_resultado_leitura(saidas.get('leitura_pdfs'))
+            if yaml_content:
+                resultados_revisao = processar_resultado_revisao(saidas.get('revisao_yaml'), pdf_path, yaml_dir)
+                if resultados_revisao:
+                    # Gerar o artigo do template com os dados já em memória
+                    try:
+                        gerar_artigo_de_dados(resultados_revisao, f'output_{sanitize_filename(pdf_path.stem)}')
+                    except Exception as e:
+                        logging.error("Erro ao gerar artigo a partir do YAML de %s: %s", pdf_path.name, e)
+
+                    pesquisa_content = processar_resultado_pesquisa(saidas.get('pesquisa_informacoes'))
+                    if pesquisa_content:
+                        # Executar tarefa de criação de artigo
+                        results_artigo = crew.kickoff(inputs=artigo_inputs)
+                        if results_artigo:
+                            saidas_artigo = indexar_saidas_por_tarefa(results_artigo.tasks_output)
+                            return processar_resultado_artigo(
+                                saidas_artigo.get('criar_artigo_linkedin'), pdf_path, markdown_dir
+                            )
+                    else:
+                        logging.error("Falha na pesquisa adicional para %s", pdf_path.name)
+                else:
+                    logging.error("Falha na revisão do YAML para %s", pdf_path.name)
+            else:
+                logging.error("Falha na extração do YAML para %s", pdf_path.name)
+
+    except Exception as e:
+        logging.error("Erro ao processar %s: %s", pdf_path.name, e, exc_info=True)
+
+    return False
+
+
+def _pdf_concluido(pdf_path: Path) -> bool:
+    """
+    Indica se o pipeline do PDF já foi concluído depois da última alteração do próprio PDF.
+
+    O artigo final (gravado por processar_resultado_artigo) é a última saída do pipeline,
+    e só existe se leitura, revisão, pesquisa e criação do artigo terminaram; o YAML
+    revisado é gravado no meio do caminho e não serve como marcador de conclusão.
+
+    Args:
+        pdf_path (Path): Caminho do PDF.
+
+    Returns:
+        bool: True se o PDF pode ser ignorado nesta execução.
+    """
+    artigo = caminho_artigo(f'artigo_{pdf_path.stem}.md')
+    try:
+        return artigo.stat().st_mtime_ns >= pdf_path.stat().st_mtime_ns
+    except OSError:
+        return False
+
+
+def _max_workers_pdfs() -> int:
+    """
+    Lê o limite de PDFs simultâneos da variável de ambiente CREW_CONCURRENCY.
+
+    Um valor que não seja inteiro é registrado como aviso e substituído por
+    MAX_WORKERS_PDFS, em vez de interromper o processamento.
+
+    Returns:
+        int: Número de workers, no mínimo 1.
+    """
+    valor = os.getenv('CREW_CONCURRENCY')
+    if valor is None:
+        return MAX_WORKERS_PDFS
+    try:
+        return max(1, int(valor))
+    except ValueError:
+        logging.warning("CREW_CONCURRENCY inválido (%r); usando %d", valor, MAX_WORKERS_PDFS)
+        return MAX_WORKERS_PDFS
+
+
+def processar_pdfs(force: bool = False) -> bool:
     """
     Processa PDFs e gera análises em YAML e artigos em Markdown usando agentes CrewAI.
 
     Esta função coordena o processamento completo de artigos científicos em PDF através de uma
     equipe de agentes especializados. O processamento ocorre em várias etapas sequenciais,
-    cada uma executada por um agente específico com uma responsabilidade única.
+    cada uma executada por um agente específico com uma responsabilidade única. PDFs
+    diferentes são independentes e processados em paralelo por um pool de processos
+    (até CREW_CONCURRENCY simultâneos, 8 por padrão). PDFs cujo artigo final já é mais recente que
+    o próprio PDF são ignorados, a menos que force seja True.
 
     Fluxo de Execução:
         1. Preparação:
            - Verifica e configura diretórios necessários (PDFs, YAMLs, Markdown)
            - Carrega configurações dos agentes e tarefas
-           - Configura o modelo de linguagem (LLM)
-           - Lista arquivos PDF disponíveis
+           - Verifica as credenciais do modelo de linguagem (LLM)
+           - Lista arquivos PDF disponíveis e descarta os já processados
 
-        2. Para cada PDF:
+        2. Para cada PDF (em um worker do pool, ver _processar_pdf):
            a. Leitura (Agente Leitor):
               - Extrai informações estruturadas do PDF
               - Gera conteúdo YAML inicial
@@ -248,9 +963,13 @@ def processar_pdfs() -> bool:
               - Transforma os dados em artigo para LinkedIn
               - Gera arquivo Markdown formatado
 
+    Args:
+        force (bool, opcional): Reprocessa todos os PDFs, mesmo os que já têm artigo
+            atualizado. Padrão: False.
+
     Returns:
-        bool: True se pelo menos um PDF foi processado com sucesso até o final,
-              False caso contrário ou em caso de erros críticos.
+        bool: True se pelo menos um PDF foi processado com sucesso até o final ou se
+              todos já estavam atualizados, False caso contrário ou em caso de erros críticos.
 
     Raises:
         FileNotFoundError: Se os diretórios necessários não forem encontrados
@@ -283,114 +1002,126 @@ def processar_pdfs() -> bool:
             return False
 
         # Listar e verificar PDFs
-        pdf_files = list(pdf_dir.glob('*.pdf'))
+        pdf_files = listar_arquivos(pdf_dir, '.pdf')
         if not pdf_files:
-            logging.warning(f"Nenhum arquivo PDF encontrado em: {pdf_dir}")
+            logging.warning("Nenhum arquivo PDF encontrado em: %s", pdf_dir)
             return False
 
-        # Configurar LLM
-        try:
-            llm = LLM(
-                model="gpt-4o-mini",
-                api_key=os.getenv('OPENAI_API_KEY'),
-                temperature=0.7
-            )
-        except KeyError:
+        # Execução incremental: ignorar PDFs cujo artigo final já está atualizado
+        if not force:
+            pendentes = []
+            for pdf_path in pdf_files:
+                if _pdf_concluido(pdf_path):
+                    logging.info("Ignorando %s: artigo já gerado", pdf_path.name)
+                else:
+                    pendentes.append(pdf_path)
+
+            if not pendentes:
+                logging.info("Todos os PDFs já foram processados; use --force para reprocessar")
+                return True
+            pdf_files = pendentes
+
+        # Verificar credenciais antes de iniciar os workers
+        if not os.getenv('OPENAI_API_KEY'):
             logging.error("OPENAI_API_KEY não encontrada nas variáveis de ambiente")
             return False
 
         processed_successfully = False
 
-        # Processar cada PDF
-        for pdf_path in pdf_files:
-            logging.info(f"\nProcessando: {pdf_path.name}")
-
-            try:
-                # Instanciar ferramentas
-                pdf_tool = PDFSearchTool(pdf=str(pdf_path))
-                serper_tool = SerperDevTool()
-
-                # Preparar inputs de leitura
-                task_config = tasks_config.get('leitura_pdfs', {}).get('inputs', {})
-                leitura_inputs = {
-                    'arquivo': pdf_path.name,
-                    'solicitacoes': task_config.get('solicitacoes', ''),
-                    'template': task_config.get('template', '').replace('nome do arquivo.pdf', pdf_path.name),
-                    'controles': task_config.get('controles', ''),
-                    'restricoes': task_config.get('restricoes', '')
-                }
-
-                # Preparar inputs para criação do artigo
-                task_config_artigo = tasks_config.get('criar_artigo_linkedin', {}).get('inputs', {})
-                artigo_inputs = {
-                    'titulo': task_config_artigo.get('titulo', ''),
-                    'hook': task_config_artigo.get('hook', ''),
-                    'secoes': task_config_artigo.get('secoes', {}),
-                    'provocacao': task_config_artigo.get('provocacao', ''),
-                    'hashtags': task_config_artigo.get('hashtags', ''),
-                    'controles': task_config_artigo.get('controles', ''),
-                    'restricoes': task_config_artigo.get('restricoes', ''),
-                    'output_file': construir_caminho_artigo_markdown(pdf_path)
-                }
-
-                # Remover chaves vazias
-                artigo_inputs = {k: v for k, v in artigo_inputs.items() if v}
-
-                # Construir caminho para o arquivo de saída do artigo
-                output_file_artigo = construir_caminho_artigo_markdown(pdf_path)
-
-                # Criar e executar equipe
-                crew_instance = RevisorArtigosSl3V1Crew(
-                    agents_config=agents_config,
-                    tasks_config=tasks_config,
-                    llm=llm,
-                    pdf_tool=pdf_tool,
-                    serper_tool=serper_tool
-                )
-                crew = crew_instance.create_crew(output_file_artigo=artigo_inputs['output_file'])
-
-                # Executar tarefa de leitura
-                results = crew.kickoff(inputs=leitura_inputs)
-                if results and hasattr(results, 'tasks_output'):
-                    yaml_content = processar_resultado_leitura(results.tasks_output)
-                    if yaml_content:
-                        resultados_revisao = processar_resultado_revisao(results.tasks_output, pdf_path, yaml_dir)
-                        if resultados_revisao:
-                            pesquisa_content = processar_resultado_pesquisa(results.tasks_output)
-                            if pesquisa_content:
-                                # Executar tarefa de criação de artigo
-                                results_artigo = crew.kickoff(inputs=artigo_inputs)
-                                if results_artigo:
-                                    processar_resultado_artigo(results_artigo.tasks_output, pdf_path, markdown_dir)
-                                    processed_successfully = True
-                            else:
-                                logging.error(f"Falha na pesquisa adicional para {pdf_path.name}")
-                        else:
-                            logging.error(f"Falha na revisão do YAML para {pdf_path.name}")
-                    else:
-                        logging.error(f"Falha na extração do YAML para {pdf_path.name}")
+        # Inputs independentes do PDF, preparados uma única vez
+        leitura_base, partes_template, artigo_base = preparar_inputs_estaticos(tasks_config)
+
+        # Maiores primeiro: os PDFs mais demorados começam logo e não ficam para o fim,
+        # quando os demais workers já estariam ociosos
+        pdf_files.sort(key=lambda pdf_path: pdf_path.stat().st_size, reverse=True)
+
+        # Processar os PDFs em paralelo, um worker por arquivo
+        max_workers = min(_max_workers_pdfs(), len(pdf_files))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_inicializar_worker,
+                                 initargs=(_log_queue,)) as executor:
+            futures = {
+                executor.submit(
+                    _processar_pdf, pdf_path, agents_config, tasks_config, yaml_dir, markdown_dir,
+                    leitura_base, partes_template, artigo_base
+                ): pdf_path
+                for pdf_path in pdf_files
+            }
 
-            except Exception as e:
-                logging.error(f"Erro ao processar {pdf_path.name}: {e}", exc_info=True)
-                continue  # Continua para o próximo PDF em caso de erro
+            for future in as_completed(futures):
+                pdf_path = futures[future]
+                try:
+                    if future.result():
+                        processed_successfully = True
+                except Exception as e:
+                    # Continua com os demais PDFs em caso de erro
+                    logging.error("Erro ao processar %s: %s", pdf_path.name, e, exc_info=True)
 
         return processed_successfully
 
     except Exception as e:
-        logging.error(f"Erro inesperado durante o processamento: {e}", exc_info=True)
+        logging.error("Erro inesperado durante o processamento: %s", e, exc_info=True)
         return False
 
 
-def processar_resultado_leitura(tasks_output: list) -> Optional[str]:
+def texto_bruto(task_output) -> str:
+    """
+    Retorna o texto produzido por uma tarefa.
+
+    Usa diretamente o campo estruturado `raw` do TaskOutput, que já é uma string;
+    a conversão com str() fica apenas como alternativa para outros tipos de saída.
+
+    Args:
+        task_output: Saída de tarefa retornada pelo CrewAI.
+
+    Returns:
+        str: Texto bruto da saída.
+    """
+    raw = getattr(task_output, 'raw', None)
+    if isinstance(raw, str):
+        return raw
+    return str(raw if raw is not None else task_output)
+
+
+def indexar_saidas_por_tarefa(tasks_output: list) -> Dict[str, Any]:
+    """
+    Indexa os outputs das tarefas pelo nome da tarefa no pipeline.
+
+    As tarefas criadas por RevisorArtigosSl3V1Crew.create_crew recebem o nome do
+    tasks.yaml, propagado para TaskOutput.name; a busca é então uma consulta ao
+    dicionário, sem comparar textos. Outputs sem nome são associados pela função
+    do agente (ver TAREFAS_POR_AGENTE).
+
+    Args:
+        tasks_output (list): Lista de outputs das tarefas executadas pelos agentes
+
+    Returns:
+        Dict[str, Any]: Mapeia o nome da tarefa para o primeiro output produzido por ela.
+
+    Example:
+        >>> saidas = indexar_saidas_por_tarefa(results.tasks_output)
+        >>> yaml_content = processar_resultado_leitura(saidas.get('leitura_pdfs'))
+    """
+    saidas = {}
+    for task_output in tasks_output:
+        nome = task_output.name
+        if nome is None:
+            nome = next((tarefa for trecho, tarefa in TAREFAS_POR_AGENTE if trecho in task_output.agent), None)
+        if nome is not None:
+            saidas.setdefault(nome, task_output)
+    return saidas
+
+
+def processar_resultado_leitura(task_output) -> Optional[str]:
     """
     Processa o resultado da tarefa de leitura do PDF, extraindo e validando o conteúdo YAML.
 
-    Esta função identifica o output do agente Leitor de PDFs, extrai o conteúdo YAML
+    Esta função recebe o output do agente Leitor de PDFs, extrai o conteúdo YAML
     e realiza validações iniciais antes de passar para o revisor. O conteúdo não é
     salvo nesta etapa, apenas processado e validado.
 
     Args:
-        tasks_output (list): Lista de outputs das tarefas executadas pelos agentes
+        task_output: Output da tarefa do Leitor de PDFs (ver indexar_saidas_por_tarefa)
+            ou None se o agente não produziu resultado
 
     Returns:
         Optional[str]: Conteúdo YAML válido ou None se:
@@ -398,14 +1129,9 @@ def processar_resultado_leitura(tasks_output: list) -> Optional[str]:
             - O YAML extraído for inválido
             - Ocorrer erro no processamento
 
-    Raises:
-        yaml.YAMLError: Se o conteúdo extraído não for um YAML válido
-        ValueError: Se o conteúdo estiver vazio ou mal formatado
-        TypeError: Se tasks_output não for uma lista
-
     Example:
-        >>> outputs = [TaskOutput(agent="Leitor de PDFs", raw="ARTIGO:\\n  - chave: valor")]
-        >>> yaml_content = processar_resultado_leitura(outputs)
+        >>> output = TaskOutput(agent="Leitor de PDFs", raw="ARTIGO:\\n  - chave: valor")
+        >>> yaml_content = processar_resultado_leitura(output)
         >>> if yaml_content:
         ...     print("YAML válido extraído")
 
@@ -414,45 +1140,32 @@ def processar_resultado_leitura(tasks_output: list) -> Optional[str]:
         e contendo a estrutura esperada de campos.
     """
     try:
-        # Validar input
-        if not isinstance(tasks_output, list):
-            raise TypeError("tasks_output deve ser uma lista")
+        if task_output is None:
+            logging.warning("Nenhum resultado do Leitor de PDFs encontrado nos outputs")
+            return None
 
-        # Procurar resultado do Leitor
-        for task_output in tasks_output:
-            if "Leitor de PDFs" in task_output.agent:
-                content = str(task_output.raw)
+        # Extrair e validar YAML (já interpretado pela extração)
+        extraido = extrair_yaml(texto_bruto(task_output))
+        if not extraido:
+            logging.warning("Conteúdo YAML não encontrado no resultado do Leitor")
+            return None
 
-                # Extrair e validar YAML
-                yaml_content = extrair_yaml_content(content)
-                if not yaml_content:
-                    logging.warning("Conteúdo YAML não encontrado no resultado do Leitor")
-                    continue
+        yaml_content, parsed_yaml = extraido
 
-                try:
-                    # Validar estrutura do YAML
-                    parsed_yaml = yaml.safe_load(yaml_content)
-                    if not isinstance(parsed_yaml, dict) or 'ARTIGO' not in parsed_yaml:
-                        raise ValueError("YAML não contém a estrutura esperada com 'ARTIGO'")
-
-                    logging.info("YAML extraído e validado com sucesso da leitura do PDF")
-                    return yaml_content
-
-                except yaml.YAMLError as e:
-                    logging.error(f"YAML extraído é inválido: {e}")
-                    return None
-                except ValueError as e:
-                    logging.error(f"Estrutura do YAML inválida: {e}")
-                    return None
-
-        logging.warning("Nenhum resultado do Leitor de PDFs encontrado nos outputs")
-        return None
+        # Validar estrutura do YAML
+        if not eh_artigo_yaml(parsed_yaml):
+            logging.error("Estrutura do YAML inválida: YAML não contém a estrutura esperada com 'ARTIGO'")
+            return None
+
+        logging.info("YAML extraído e validado com sucesso da leitura do PDF")
+        return yaml_content
 
     except Exception as e:
-        logging.error(f"Erro ao processar resultado da leitura: {e}", exc_info=True)
+        logging.error("Erro ao processar resultado da leitura: %s", e, exc_info=True)
         return None
 
-def processar_resultado_revisao(tasks_output: list, pdf_path: Path, yaml_dir: Path) -> bool:
+
+def processar_resultado_revisao(task_output, pdf_path: Path, yaml_dir: Path) -> Optional[ArtigoYAML]:
     """
     Processa o resultado da tarefa de revisão e salva o YAML validado.
 
@@ -460,78 +1173,73 @@ def processar_resultado_revisao(tasks_output: list, pdf_path: Path, yaml_dir: Pa
     gerado pelo leitor, e salva o resultado final em um arquivo YAML.
 
     Args:
-        tasks_output (list): Lista de outputs das tarefas
+        task_output: Output da tarefa do Revisor (ver indexar_saidas_por_tarefa)
+            ou None se o agente não produziu resultado
         pdf_path (Path): Caminho do arquivo PDF processado
         yaml_dir (Path): Diretório para salvar os arquivos YAML
 
     Returns:
-        bool: True se o YAML foi processado e salvo com sucesso
+        Optional[ArtigoYAML]: Conteúdo do YAML salvo, já carregado, ou None em caso de falha
 
     Example:
-        >>> tasks_output = [...]  # Lista de outputs das tarefas
+        >>> saidas = indexar_saidas_por_tarefa(tasks_output)
         >>> pdf_path = Path("artigo.pdf")
         >>> yaml_dir = Path("yamls")
-        >>> if processar_resultado_revisao(tasks_output, pdf_path, yaml_dir):
+        >>> if processar_resultado_revisao(saidas.get('revisao_yaml'), pdf_path, yaml_dir):
         ...     print("YAML revisado e salvo com sucesso")
     """
     try:
-        logging.info(f"Iniciando processamento de revisão para: {pdf_path.name}")
-        logging.info(f"Diretório destino YAML: {yaml_dir}")
+        logging.info("Iniciando processamento de revisão para: %s", pdf_path.name)
+        logging.debug("Diretório destino YAML: %s", yaml_dir)
 
-        for task_output in tasks_output:
-            logging.info(f"Processando output do agente: {task_output.agent}")
+        if task_output is None:
+            logging.warning("Nenhum output do Revisor encontrado nos resultados")
+            return None
 
-            if "Revisor" in task_output.agent:
-                content = str(task_output.raw)
-                logging.info("Conteúdo bruto do revisor obtido")
+        # A extração já valida e interpreta o YAML; o resultado é reaproveitado
+        extraido = extrair_yaml(texto_bruto(task_output))
+        yaml_content, article_data = extraido if extraido else (None, None)
+        logging.debug("YAML extraído: %s", 'Sim' if yaml_content else 'Não')
 
-                yaml_content = extrair_yaml_content(content)
-                logging.info(f"YAML extraído: {'Sim' if yaml_content else 'Não'}")
+        if not yaml_content:
+            logging.error("Nenhum conteúdo YAML válido encontrado na revisão")
+            return None
 
-                if yaml_content:
-                    try:
-                        # Validar e carregar o YAML
-                        article_data = yaml.safe_load(yaml_content)
-                        logging.info("YAML carregado com sucesso")
-
-                        if article_data and isinstance(article_data, dict):
-                            # Sanitizar nome do arquivo
-                            sanitized_pdf_name = sanitize_filename(pdf_path.stem)
-                            logging.info(f"Nome sanitizado: {sanitized_pdf_name}")
-
-                            # Criar o caminho do arquivo YAML
-                            yaml_file = yaml_dir / f'output_{sanitized_pdf_name}.yaml'
-                            logging.info(f"Caminho do arquivo YAML: {yaml_file}")
-
-                            # Verificar se o diretório existe e tem permissão de escrita
-                            if not yaml_dir.exists():
-                                logging.error(f"Diretório não existe: {yaml_dir}")
-                                return False
-
-                            if not os.access(yaml_dir, os.W_OK):
-                                logging.error(f"Sem permissão de escrita em: {yaml_dir}")
-                                return False
-
-                            # Salvar YAML
-                            with open(yaml_file, 'w', encoding='utf-8') as file:
-                                yaml.dump(article_data, file,
-                                          default_flow_style=False,
-                                          allow_unicode=True,
-                                          sort_keys=False)
-                                logging.info(f"YAML salvo com sucesso em: {yaml_file}")
-                            return True
-
-                    except yaml.YAMLError as e:
-                        logging.error(f"Erro no parse do YAML revisado: {e}")
-                else:
-                    logging.error("Nenhum conteúdo YAML válido encontrado na revisão")
+        if not eh_artigo_yaml(article_data):
+            logging.warning("YAML revisado sem conteúdo estruturado")
+            return None
 
-        logging.warning("Nenhum output do Revisor encontrado nos resultados")
-        return False
+        # Sanitizar nome do arquivo
+        sanitized_pdf_name = sanitize_filename(pdf_path.stem)
+        logging.debug("Nome sanitizado: %s", sanitized_pdf_name)
+
+        # Criar o caminho do arquivo YAML
+        yaml_file = yaml_dir / f'output_{sanitized_pdf_name}.yaml'
+        logging.debug("Caminho do arquivo YAML: %s", yaml_file)
+
+        # Verificar se o diretório existe e tem permissão de escrita
+        if not yaml_dir.exists():
+            logging.error("Diretório não existe: %s", yaml_dir)
+            return None
+
+        if not os.access(yaml_dir, os.W_OK):
+            logging.error("Sem permissão de escrita em: %s", yaml_dir)
+            return None
+
+        # Salvar YAML
+        try:
+            escrever_yaml_atomico(yaml_file, article_data, sort_keys=False)
+        except yaml.YAMLError as e:
+            logging.error("Erro ao serializar o YAML revisado: %s", e)
+            return None
+
+        salvar_json_intermediario(yaml_file, article_data)
+        logging.info("YAML salvo com sucesso em: %s", yaml_file)
+        return article_data
 
     except Exception as e:
-        logging.error(f"Erro ao processar revisão: {e}", exc_info=True)
-        return False
+        logging.error("Erro ao processar revisão: %s", e, exc_info=True)
+        return None
 
 
 # Função para sanitizar o nome do arquivo removendo caracteres inválidos
@@ -540,7 +1248,7 @@ def sanitize_filename(filename):
     Remove caracteres inválidos do nome do arquivo.
     Substitui caracteres como \ / : * ? " < > | e \n por _.
     """
-    return re.sub(r'[\\/*?:"<>|\n]', '_', filename)
+    return filename.translate(_NOME_INVALIDO_TABELA)
 
 
 def limpar_conteudo_yaml(content: str) -> str:
@@ -565,145 +1273,101 @@ def limpar_conteudo_yaml(content: str) -> str:
     if not content:
         return ""
 
-    # Remover blocos de código markdown
-    content = re.sub(r'```+\s*yaml\s*', '', content)
-    content = re.sub(r'```+', '', content)
-
-    # Remover caracteres especiais problemáticos
-    content = re.sub(r'[`]', '', content)
+    # Remover blocos de código markdown e crases problemáticas
+    content = _CERCAS_YAML_RE.sub('', content)
 
-    # Limpar espaços extras e linhas em branco
-    lines = [line.rstrip() for line in content.splitlines()]
-    content = '\n'.join(line for line in lines if line.strip())
+    # Limpar espaços extras e linhas em branco: após o rstrip, linhas só com espaços ficam vazias
+    return '\n'.join(filter(None, map(str.rstrip, content.splitlines()))).strip()
 
-    return content.strip()
 
-
-def extrair_yaml_content(content: str) -> Optional[str]:
+def extrair_yaml(content: str) -> Optional[Tuple[str, Any]]:
     """
-    Extrai e processa o conteúdo YAML de uma string bruta.
+    Extrai o conteúdo YAML de uma string bruta e retorna o texto junto com o resultado do parse.
 
-    Esta função identifica o bloco YAML dentro do conteúdo,
-    limpa formatações indesejadas e valida a estrutura do YAML.
+    O YAML é interpretado uma única vez, na validação; quem precisa dos dados usa o
+    objeto retornado em vez de interpretar o texto novamente.
 
     Args:
         content (str): String contendo o conteúdo bruto
 
     Returns:
-        Optional[str]: Conteúdo YAML processado ou None se inválido
-
-    Raises:
-        yaml.YAMLError: Se o conteúdo YAML for inválido após processamento
+        Optional[Tuple[str, Any]]: Texto YAML processado e seu conteúdo interpretado,
+            ou None se não houver YAML válido
 
     Example:
-        >>> content = "Algum texto\\nARTIGO:\\n  - chave: valor"
-        >>> yaml_content = extrair_yaml_content(content)
-        >>> print(yaml_content)
-        ARTIGO:
-          - chave: valor
+        >>> yaml_content, dados = extrair_yaml("Algum texto\\nARTIGO:\\n  - chave: valor")
+        >>> dados
+        {'ARTIGO': [{'chave': 'valor'}]}
     """
     try:
         if not content:
             return None
 
-        # Primeiro limpar o conteúdo
-        content = limpar_conteudo_yaml(content)
-
-        # Extrair seção YAML
-        if "ARTIGO:" in content:
-            # Pegar do ARTIGO: até o final ou próxima seção
-            yaml_content = content[content.find("ARTIGO:"):]
+        if len(content) > MAX_TAMANHO_YAML:
+            logging.error("Conteúdo com %s caracteres excede o limite para YAML", len(content))
+            return None
 
-            # Validar se é um YAML válido
-            try:
-                yaml.safe_load(yaml_content)
-                return yaml_content
-            except yaml.YAMLError:
-                logging.error("Conteúdo extraído não é um YAML válido")
+        # Localizar o ARTIGO: no texto bruto e limpar só a seção YAML, sem percorrer
+        # o preâmbulo da resposta. A busca é repetida no texto limpo apenas quando o
+        # marcador não aparece no bruto (ex.: interrompido por crases).
+        inicio = content.find("ARTIGO:")
+        if inicio >= 0:
+            yaml_content = limpar_conteudo_yaml(content[inicio:])
+        else:
+            content = limpar_conteudo_yaml(content)
+            inicio = content.find("ARTIGO:")
+            if inicio < 0:
                 return None
+            yaml_content = content[inicio:]
 
-        return None
+        # Validar se é um YAML válido
+        try:
+            return yaml_content, yaml.load(yaml_content, Loader=SafeLoader)
+        except yaml.YAMLError:
+            logging.error("Conteúdo extraído não é um YAML válido")
+            return None
 
     except Exception as e:
-        logging.error(f"Erro ao extrair YAML: {e}", exc_info=True)
+        logging.error("Erro ao extrair YAML: %s", e, exc_info=True)
         return None
 
 
-def processar_resultado_yaml(tasks_output: list, pdf_path: Path, yaml_dir: Path) -> bool:
+def extrair_yaml_content(content: str) -> Optional[str]:
     """
-    Processa o resultado das tarefas de leitura e revisão de PDFs, salvando o conteúdo em um arquivo YAML.
+    Extrai e processa o conteúdo YAML de uma string bruta.
 
-    Esta função percorre a lista de outputs das tarefas, identifica os agentes responsáveis pela leitura e revisão
-    de PDFs, extrai o conteúdo YAML, e salva o resultado em um arquivo no diretório especificado.
+    Esta função identifica o bloco YAML dentro do conteúdo,
+    limpa formatações indesejadas e valida a estrutura do YAML.
+    Para obter também o conteúdo interpretado, use extrair_yaml.
 
     Args:
-        tasks_output (list): Lista de outputs das tarefas executadas pela equipe de agentes.
-        pdf_path (Path): Caminho do arquivo PDF sendo processado, usado para nomear o arquivo YAML.
-        yaml_dir (Path): Diretório onde o arquivo YAML será salvo.
+        content (str): String contendo o conteúdo bruto
 
     Returns:
-        bool: Retorna True se o YAML for processado e salvo com sucesso, caso contrário, retorna False.
-
-    Raises:
-        yaml.YAMLError: Se houver erro no processamento do YAML.
-        OSError: Se houver um erro ao salvar o arquivo YAML.
+        Optional[str]: Conteúdo YAML processado ou None se inválido
 
     Example:
-        >>> tasks_output = [...]  # Lista de outputs das tarefas
-        >>> pdf_path = Path("/caminho/para/arquivo.pdf")
-        >>> yaml_dir = Path("/caminho/para/yaml")
-        >>> sucesso = processar_resultado_yaml(tasks_output, pdf_path, yaml_dir)
-        >>> if sucesso:
-        ...     print("Arquivo YAML salvo com sucesso")
+        >>> content = "Algum texto\\nARTIGO:\\n  - chave: valor"
+        >>> yaml_content = extrair_yaml_content(content)
+        >>> print(yaml_content)
+        ARTIGO:
+          - chave: valor
     """
-    try:
-        for task_output in tasks_output:
-            if "Leitor de PDFs" in task_output.agent or "Revisor" in task_output.agent:
-                content = str(task_output.raw)
-
-                yaml_content = None
-                if "```yaml" in content:
-                    yaml_content = content.split("```yaml")[1].split("```")[0].strip()
-                elif "ARTIGO:" in content:
-                    yaml_content = content[content.find("ARTIGO:"):]
-
-                if yaml_content:
-                    try:
-                        article_data = yaml.safe_load(yaml_content)
-                        if article_data and isinstance(article_data, dict):
-                            # Sanitizar nome do arquivo PDF e do agente
-                            sanitized_pdf_name = sanitize_filename(pdf_path.stem)
-                            sanitized_agent_name = sanitize_filename(task_output.agent)
+    extraido = extrair_yaml(content)
+    return extraido[0] if extraido else None
 
-                            # Criar o caminho do arquivo YAML
-                            yaml_file = yaml_dir / f'output_{sanitized_pdf_name}_{sanitized_agent_name}.yaml'
 
-                            # Salvar o arquivo YAML
-                            with open(yaml_file, 'w', encoding='utf-8') as file:
-                                yaml.dump(article_data, file, default_flow_style=False, allow_unicode=True)
-
-                            logging.info(f"YAML salvo em: {yaml_file}")
-                            return True
-
-                    except yaml.YAMLError as e:
-                        logging.error(f"Erro ao processar YAML: {e}", exc_info=True)
-
-    except OSError as e:
-        logging.error(f"Erro ao salvar arquivo YAML: {e}", exc_info=True)
-
-    return False
-
-
-def processar_resultado_pesquisa(tasks_output: list) -> Optional[str]:
+def processar_resultado_pesquisa(task_output) -> Optional[str]:
     """
     Processa o resultado da tarefa de pesquisa adicional realizada pelo agente pesquisador.
 
-    Esta função analisa os outputs das tarefas e extrai as informações de contexto e
-    dados adicionais obtidos pelo agente pesquisador, que serão utilizados pelo
-    agente criador de artigos para enriquecer o conteúdo.
+    Esta função analisa o output do agente pesquisador e extrai as informações de
+    contexto e dados adicionais obtidos, que serão utilizados pelo agente criador de
+    artigos para enriquecer o conteúdo.
 
     Args:
-        tasks_output (list): Lista de outputs das tarefas executadas pela equipe de agentes
+        task_output: Output da tarefa do Pesquisador (ver indexar_saidas_por_tarefa)
+            ou None se o agente não produziu resultado
 
     Returns:
         Optional[str]: Conteúdo processado da pesquisa ou None se não houver
@@ -713,33 +1377,32 @@ def processar_resultado_pesquisa(tasks_output: list) -> Optional[str]:
         ValueError: Se o conteúdo da pesquisa estiver em formato inválido
 
     Example:
-        >>> tasks_output = [...]  # Lista de outputs das tarefas
-        >>> pesquisa = processar_resultado_pesquisa(tasks_output)
+        >>> saidas = indexar_saidas_por_tarefa(tasks_output)
+        >>> pesquisa = processar_resultado_pesquisa(saidas.get('pesquisa_informacoes'))
         >>> if pesquisa:
         ...     print("Informações adicionais obtidas com sucesso")
     """
     try:
-        for task_output in tasks_output:
-            if "Pesquisador" in task_output.agent:
-                content = str(task_output.raw)
-
-                if content:
-                    # Limpar e validar o conteúdo
-                    content = content.strip()
-
-                    # Verificar se há conteúdo substancial
-                    if len(content) > 10:  # Critério mínimo arbitrário
-                        logging.info("Resultado da pesquisa processado com sucesso")
-                        return content
-                    else:
-                        logging.warning("Conteúdo da pesquisa muito curto ou vazio")
-                        return None
+        if task_output is None:
+            logging.warning("Nenhum resultado do Pesquisador encontrado")
+            return None
+
+        # Limpar e validar o conteúdo. Se nem o texto bruto passa do mínimo, o texto
+        # sem espaços também não passa e o strip é dispensado
+        content = texto_bruto(task_output)
+        if len(content) > 10:
+            content = content.strip()
 
-        logging.warning("Nenhum resultado do Pesquisador encontrado")
+        # Verificar se há conteúdo substancial
+        if len(content) > 10:  # Critério mínimo arbitrário
+            logging.info("Resultado da pesquisa processado com sucesso")
+            return content
+
+        logging.warning("Conteúdo da pesquisa muito curto ou vazio")
         return None
 
     except Exception as e:
-        logging.error(f"Erro ao processar resultado da pesquisa: {e}", exc_info=True)
+        logging.error("Erro ao processar resultado da pesquisa: %s", e, exc_info=True)
         return None
 
 
@@ -756,7 +1419,8 @@ def generate_linkedin_article(article_data: Dict, pdf_file_name: str, task_confi
         task_config (Dict): Configurações da tarefa, incluindo parâmetros adicionais para o artigo.
 
     Returns:
-        Optional[str]: Conteúdo do artigo em formato Markdown ou None se ocorrer um erro.
+        Optional[str]: Conteúdo do artigo em formato Markdown ou None se os dados não
+            tiverem seções em ARTIGO.
 
     Raises:
         ValueError: Se os dados do artigo estiverem em formato inválido ou faltando informações essenciais.
@@ -769,51 +1433,118 @@ def generate_linkedin_article(article_data: Dict, pdf_file_name: str, task_confi
         🔬 #CiênciaNaPrática
         # exemplo.pdf
     """
-    try:
-        content = []
-
-        # Cabeçalho do artigo
-        content.append("🔬 #CiênciaNaPrática")
-        content.append(f"\n# {pdf_file_name}\n")
-        content.append("---\n")
-
-        # Processar dados do YAML
-        if isinstance(article_data, dict) and 'ARTIGO' in article_data:
-            artigo = article_data['ARTIGO']
-
-            if isinstance(artigo, list) and len(artigo) > 0:
-                artigo = artigo[0]
-
-            # Seções principais do artigo
-            sections = {
-                'GAP': '🎯 Por que isso importa?',
-                'OBJETIVOS': '💡 O que descobrimos?',
-                'METODOLOGIA': '🔍 Como chegamos lá?',
-                'RESULTADOS': '📊 O que encontramos?',
-                'LIMITAÇÕES': '⚠️ Quais são os desafios?',
-                'FUTURO': '🔮 O que vem a seguir?'
-            }
+    # Validar os dados antes de montar qualquer parte do artigo
+    artigo = article_data['ARTIGO'] if eh_artigo_yaml(article_data) else None
 
-            # Adicionar conteúdo das seções
-            for key, title in sections.items():
-                if key in artigo:
-                    content.append(f"\n## {title}\n")
-                    content.append(artigo[key])
-                    content.append("\n")
+    # O template lista cada seção como um item {SEÇÃO: conteúdo}; os itens são unidos
+    # em um único dict (um único item com todas as seções também é aceito)
+    if artigo.__class__ is list:
+        artigo = {chave: valor for item in artigo if item.__class__ is dict for chave, valor in item.items()}
+
+    if not artigo or artigo.__class__ is not dict:
+        logging.warning("Dados do artigo %s sem seções em ARTIGO", pdf_file_name)
+        return None
+
+    # Montar o conteúdo das seções presentes
+    secoes = ''.join(
+        f"\n\n## {title}\n\n{artigo[key]}\n\n"
+        for key, title in SECOES_ARTIGO if key in artigo
+    )
+
+    # Cabeçalho, seções, call-to-action e hashtags
+    return ''.join((CABECALHO_ARTIGO.format(pdf_file_name=pdf_file_name), secoes, RODAPE_ARTIGO))
+
+
+def gerar_artigo_de_dados(article_data: ArtigoYAML, nome_base: str) -> bool:
+    """
+    Gera e salva o artigo em Markdown a partir dos dados do YAML já carregados.
+
+    Usada logo após a revisão, com os dados ainda em memória, evitando reler e
+    reprocessar o arquivo YAML recém-salvo.
+
+    Args:
+        article_data (ArtigoYAML): Conteúdo do YAML revisado.
+        nome_base (str): Nome base do artigo (o stem do arquivo YAML).
+
+    Returns:
+        bool: True se o artigo foi gerado e salvo.
+    """
+    md_filename = f"{nome_base}.md"
+
+    article_content = generate_linkedin_article(article_data, nome_base, {})
+
+    if not article_content:
+        logging.error("Erro: Conteúdo vazio para %s", nome_base)
+        return False
+
+    save_article(article_content, md_filename)
+    logging.info("Artigo gerado com sucesso: %s", md_filename)
+    return True
+
+
+def _gerar_artigo_de_yaml(yaml_file: Path, hash_registrado: Optional[str] = None) -> Optional[str]:
+    """
+    Gera e salva o artigo em Markdown correspondente a um arquivo YAML.
+
+    Se o conteúdo do YAML tem o mesmo hash registrado na última geração e o artigo
+    existe, nada é regenerado (ex.: YAML regravado com o mesmo conteúdo). Erros são
+    registrados no log sem interromper o processamento dos demais arquivos.
+
+    Args:
+        yaml_file (Path): Caminho do arquivo YAML revisado.
+        hash_registrado (str, opcional): Hash do YAML no manifesto de artigos.
+
+    Returns:
+        Optional[str]: Hash do conteúdo do YAML, se o artigo está em dia, ou None em caso de falha.
+    """
+    try:
+        digest = calcular_hash_arquivo(yaml_file)
+        if digest == hash_registrado and caminho_artigo(f"{yaml_file.stem}.md").exists():
+            logging.debug("YAML %s inalterado; artigo mantido", yaml_file.name)
+            return digest
 
-        # Call-to-action
-        content.append("\n## 💭 E você, o que acha?\n")
-        content.append("Como essas descobertas podem impactar sua área? Compartilhe suas ideias! 👇\n")
+        logging.info("Processando arquivo YAML: %s", yaml_file.name)
 
-        # Hashtags
-        content.append("\n---\n")
-        content.append("#IA #Pesquisa #Inovação #Tecnologia #Desenvolvimento #Ciência")
+        yaml_content = carregar_dados_revisados(yaml_file)
 
-        return '\n'.join(content)
+        if eh_artigo_yaml(yaml_content) and gerar_artigo_de_dados(yaml_content, yaml_file.stem):
+            return digest
 
     except Exception as e:
-        logging.error(f"Erro ao gerar artigo: {e}")
-        return None
+        logging.error("Erro ao processar %s: %s", yaml_file.name, e)
+
+    return None
+
+
+def _ler_manifesto_artigos() -> Dict[str, str]:
+    """
+    Lê o manifesto com o hash de cada YAML cujo artigo já foi gerado.
+
+    Returns:
+        Dict[str, str]: Nome do YAML para o hash do conteúdo; vazio se não houver manifesto válido.
+    """
+    try:
+        with open(MANIFESTO_ARTIGOS, 'rb') as file:
+            manifesto = _json_loads(file.read())
+    except (OSError, ValueError):
+        return {}
+    return manifesto if manifesto.__class__ is dict else {}
+
+
+def _artigo_atualizado(yaml_file: Path) -> bool:
+    """
+    Indica se o artigo do YAML já existe e é mais recente que o próprio YAML.
+
+    Args:
+        yaml_file (Path): Caminho do arquivo YAML revisado.
+
+    Returns:
+        bool: True se o artigo pode ser reaproveitado.
+    """
+    try:
+        return caminho_artigo(f"{yaml_file.stem}.md").stat().st_mtime_ns >= yaml_file.stat().st_mtime_ns
+    except OSError:
+        return False
 
 
 def gerar_artigos_a_partir_de_yaml() -> None:
@@ -821,7 +1552,10 @@ def gerar_artigos_a_partir_de_yaml() -> None:
     Gera artigos em Markdown a partir dos arquivos YAML existentes.
 
     Processa todos os arquivos YAML no diretório de YAMLs e gera os artigos
-    correspondentes em formato Markdown para o LinkedIn.
+    correspondentes em formato Markdown para o LinkedIn. Os arquivos são
+    processados em paralelo por um pool de threads. YAMLs cujo artigo já é mais
+    recente que o arquivo (ex.: gerado por processar_pdfs nesta execução) são ignorados,
+    assim como os de conteúdo idêntico ao registrado em MANIFESTO_ARTIGOS.
 
     Raises:
         FileNotFoundError: Se o diretório de YAMLs não existir
@@ -836,36 +1570,34 @@ def gerar_artigos_a_partir_de_yaml() -> None:
         # Usar verificar_estrutura_diretorios para obter caminhos corretos
         _, yaml_dir, _ = verificar_estrutura_diretorios()
 
-        yaml_files = list(yaml_dir.glob('output_*.yaml'))
-
-        for yaml_file in yaml_files:
-            try:
-                logging.info(f"Processando arquivo YAML: {yaml_file.name}")
-
-                with open(yaml_file, 'r', encoding='utf-8') as f:
-                    yaml_content = yaml.safe_load(f)
+        yaml_files = [
+            yaml_file for yaml_file in listar_arquivos(yaml_dir, '.yaml', prefixo='output_')
+            if not _artigo_atualizado(yaml_file)
+        ]
 
-                if yaml_content and isinstance(yaml_content, dict):
-                    md_filename = f"{yaml_file.stem}.md"
+        if not yaml_files:
+            logging.info("Nenhum YAML pendente para gerar artigos")
+            return
 
-                    article_content = generate_linkedin_article(
-                        yaml_content,
-                        yaml_file.stem,
-                        {}
-                    )
+        manifesto = _ler_manifesto_artigos()
 
-                    if article_content:
-                        save_article(article_content, md_filename)
-                        logging.info(f"Artigo gerado com sucesso: {md_filename}")
-                    else:
-                        logging.error(f"Erro: Conteúdo vazio para {yaml_file.name}")
+        # Arquivos independentes: leitura, parse e escrita sobrepostos em threads
+        max_workers = min(8, (os.cpu_count() or 1) * 2, len(yaml_files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            hashes = executor.map(
+                _gerar_artigo_de_yaml, yaml_files, [manifesto.get(yaml_file.name) for yaml_file in yaml_files]
+            )
+            manifesto.update(
+                (yaml_file.name, digest) for yaml_file, digest in zip(yaml_files, hashes) if digest
+            )
 
-            except Exception as e:
-                logging.error(f"Erro ao processar {yaml_file.name}: {e}")
-                continue
+        try:
+            escrever_arquivo_atomico(MANIFESTO_ARTIGOS, _json_dumps(manifesto))
+        except OSError as e:
+            logging.warning("Não foi possível gravar o manifesto de artigos: %s", e)
 
     except Exception as e:
-        logging.error(f"Erro ao acessar diretório de YAMLs: {e}")
+        logging.error("Erro ao acessar diretório de YAMLs: %s", e)
         raise
 
 
@@ -892,17 +1624,13 @@ def limpar_conteudo_markdown(content: str) -> str:
         return ""
 
     # Remover blocos de código markdown
-    content = re.sub(r'```+\s*markdown\s*', '', content)
-    content = re.sub(r'```+', '', content)
+    content = _CERCAS_MARKDOWN_RE.sub('', content)
 
     # Limpar espaços extras e linhas em branco consecutivas
-    lines = [line.rstrip() for line in content.splitlines()]
-    content = '\n'.join(line for line in lines if line.strip())
-
-    return content.strip()
+    return _QUEBRAS_EM_BRANCO_RE.sub('\n', content).strip()
 
 
-def processar_resultado_artigo(tasks_output: list, pdf_path: Path, markdown_dir: Path) -> bool:
+def processar_resultado_artigo(task_output, pdf_path: Path, markdown_dir: Path) -> bool:
     """
     Processa o resultado da tarefa de criação do artigo em Markdown.
 
@@ -910,7 +1638,8 @@ def processar_resultado_artigo(tasks_output: list, pdf_path: Path, markdown_dir:
     valida o conteúdo e o salva no diretório de artigos.
 
     Args:
-        tasks_output (list): Lista de outputs das tarefas executadas.
+        task_output: Output da tarefa do Criador de Artigos (ver indexar_saidas_por_tarefa)
+            ou None se o agente não produziu resultado.
         pdf_path (Path): Caminho do arquivo PDF original, usado para nomear o artigo.
         markdown_dir (Path): Diretório onde o arquivo Markdown será salvo.
 
@@ -922,29 +1651,46 @@ def processar_resultado_artigo(tasks_output: list, pdf_path: Path, markdown_dir:
         OSError: Se houver falha ao salvar o arquivo.
 
     Exemplo:
-        >>> success = processar_resultado_artigo(tasks_output, Path("artigo.pdf"), Path("artigos_markdown"))
+        >>> saidas = indexar_saidas_por_tarefa(tasks_output)
+        >>> success = processar_resultado_artigo(saidas.get('criar_artigo_linkedin'), Path("artigo.pdf"),
+        ...                                      Path("artigos_markdown"))
         >>> print("Artigo processado" if success else "Falha no processamento")
     """
-    try:
-        for task_output in tasks_output:
-            if "Criador de Artigos" in task_output.agent:
-                content = str(task_output.raw)
-
-                if content:
-                    # Gerar nome do arquivo
-                    md_filename = f'artigo_{pdf_path.stem}.md'
-
-                    # Salvar artigo
-                    save_article(content, md_filename)
-                    return True
+    content = texto_bruto(task_output) if task_output is not None else None
 
+    if not content:
         logging.error("Nenhum conteúdo de artigo encontrado")
         return False
 
-    except Exception as e:
-        logging.error(f"Erro ao processar artigo Markdown: {e}", exc_info=True)
+    # Gerar nome do arquivo e salvar o artigo
+    md_filename = f'artigo_{pdf_path.stem}.md'
+    try:
+        save_article(content, md_filename)
+    except (OSError, ValueError) as e:
+        logging.error("Erro ao processar artigo Markdown: %s", e, exc_info=True)
         return False
 
+    return True
+
+
+@lru_cache(maxsize=1024)
+def caminho_artigo(file_name: str) -> Path:
+    """
+    Retorna o caminho em que save_article grava o artigo com o nome informado.
+
+    O resultado é memorizado: o mesmo nome é consultado por _artigo_atualizado,
+    _gerar_artigo_de_yaml e save_article a cada YAML.
+
+    Args:
+        file_name (str): Nome do arquivo, incluindo extensão.
+
+    Returns:
+        Path: Caminho do artigo, com o nome sanitizado.
+    """
+    sanitized_name = _NOME_ARTIGO_INVALIDO_RE.sub('_', file_name)
+    sanitized_name = _SUBLINHADOS_RE.sub('_', sanitized_name)
+    return ARTIGOS_MARKDOWN_DIR / sanitized_name
+
 
 def save_article(content: str, file_name: str) -> None:
     """
@@ -967,36 +1713,36 @@ def save_article(content: str, file_name: str) -> None:
         >>> save_article(content, "Artigo_Test.md")
         Artigo salvo com sucesso em: .../artigos_markdown/Artigo_Test.md
     """
-    try:
-        if not content:
-            raise ValueError("Conteúdo do artigo está vazio")
-        if not file_name:
-            raise ValueError("Nome do arquivo está vazio")
+    if not content:
+        raise ValueError("Conteúdo do artigo está vazio")
+    if not file_name:
+        raise ValueError("Nome do arquivo está vazio")
 
-        # Limpar e sanitizar nome do arquivo
-        sanitized_name = re.sub(r'[^\w\-\.]', '_', file_name)
-        sanitized_name = re.sub(r'_+', '_', sanitized_name)
+    # Criar caminho completo do arquivo, com o nome sanitizado
+    file_path = caminho_artigo(file_name)
 
-        # Diretório base de artigos
-        articles_dir = Path('src/revisor_artigos_sl3v1/resources/artigos_markdown')
-        articles_dir.mkdir(parents=True, exist_ok=True)
+    # Salvar o arquivo. Sem permissão de escrita, a criação do temporário já levanta
+    # PermissionError; o diretório só é recriado se tiver sido removido durante a execução
+    try:
+        try:
+            escrever_arquivo_atomico(file_path, content)
+        except FileNotFoundError:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            escrever_arquivo_atomico(file_path, content)
+    except OSError as e:
+        logging.error("Erro ao salvar artigo: %s", e)
+        raise
 
-        # Verificar permissões de escrita
-        if not os.access(articles_dir, os.W_OK):
-            raise PermissionError(f"Sem permissão de escrita em: {articles_dir}")
+    logging.info("Artigo salvo com sucesso em: %s", file_path)
 
-        # Criar caminho completo do arquivo
-        file_path = articles_dir / sanitized_name
 
-        # Salvar o arquivo
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+# Fila de registros de log do processo principal, criada por setup_logging
+_log_queue: Optional[Any] = None
 
-        logging.info(f"Artigo salvo com sucesso em: {file_path}")
 
-    except Exception as e:
-        logging.error(f"Erro ao salvar artigo: {e}")
-        raise
+def _nivel_log() -> str:
+    """Retorna o nível de log definido pela variável de ambiente LOGLEVEL (padrão: INFO)."""
+    return os.getenv('LOGLEVEL', 'INFO').upper()
 
 
 def setup_logging() -> None:
@@ -1004,28 +1750,52 @@ def setup_logging() -> None:
     Configura o sistema de logging para o aplicativo.
 
     Cria um logger que escreve tanto no console quanto em um arquivo de log,
-    com timestamps e níveis de log apropriados.
+    com timestamps e níveis de log apropriados. O nível pode ser ajustado pela
+    variável de ambiente LOGLEVEL (padrão: INFO).
 
     Example:
         >>> setup_logging()
         Logger configurado: logs/revisor_artigos_20241027.log
     """
-    project_root = Path(__file__).resolve().parent.parent.parent
-    log_dir = project_root / 'logs'
-    log_dir.mkdir(exist_ok=True)
-
-    log_file = log_dir / f'revisor_artigos_{dt.now():%Y%m%d}.log'
+    global _log_queue
+
+    agora = dt.now()
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    log_file = LOG_DIR / f"revisor_artigos_{agora.strftime('%Y%m%d')}.log"
+
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    stream_handler = logging.StreamHandler(sys.stdout)
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+
+    # O arquivo recebe os registros em lotes: são gravados a cada 256 registros ou
+    # imediatamente a partir de WARNING. O console continua registro a registro.
+    buffer_arquivo = logging.handlers.MemoryHandler(
+        capacity=256, flushLevel=logging.WARNING, target=file_handler
+    )
+    atexit.register(buffer_arquivo.close)
+
+    # Os registros entram em uma fila e são escritos por uma thread dedicada, de modo que
+    # quem registra não espera pela escrita no arquivo/console. A fila é de multiprocessing
+    # para que os workers do pool de PDFs também possam usá-la (ver _inicializar_worker).
+    _log_queue = multiprocessing.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        _log_queue, buffer_arquivo, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Registrado depois do buffer: o atexit executa em ordem inversa, então a fila é
+    # esvaziada antes de o buffer ser gravado no arquivo
+    atexit.register(listener.stop)
 
     logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
+        level=_nivel_log(),
+        handlers=[logging.handlers.QueueHandler(_log_queue)]
     )
 
-    logging.info(f"Iniciando processamento de artigos - {dt.now():%Y-%m-%d %H:%M:%S}")
+    logging.info("Iniciando processamento de artigos - %s", agora.strftime('%Y-%m-%d %H:%M:%S'))
+    if not YAML_EM_C:
+        logging.debug("libyaml indisponível ou desativada; utilizando o parser YAML em Python")
 
 
 def run() -> None:
@@ -1037,7 +1807,9 @@ def run() -> None:
     2. Processamento de PDFs e geração de YAMLs
     3. Geração de artigos em Markdown para LinkedIn
 
-    O processo é interrompido se houver falha em alguma etapa crítica.
+    O processo é interrompido se houver falha em alguma etapa crítica. PDFs que já
+    têm artigo atualizado são ignorados; passe --force na linha de comando para
+    reprocessá-los.
 
     Raises:
         SystemExit: Se houver falha em alguma etapa crítica do processo
@@ -1052,10 +1824,11 @@ def run() -> None:
     try:
         # Configuração inicial
         setup_logging()
+        setup_directories()
         logging.info("Iniciando pipeline de processamento")
 
-        # Processamento dos PDFs
-        if not processar_pdfs():
+        # Processamento dos PDFs (--force reprocessa os que já têm artigo atualizado)
+        if not processar_pdfs(force='--force' in sys.argv[1:]):
             logging.error("Falha no processamento dos PDFs")
             raise SystemExit("Falha no processamento dos PDFs")
 
@@ -1064,13 +1837,13 @@ def run() -> None:
             gerar_artigos_a_partir_de_yaml()
             logging.info("Artigos gerados com sucesso")
         except Exception as e:
-            logging.error(f"Erro na geração dos artigos: {str(e)}", exc_info=True)
+            logging.error("Erro na geração dos artigos: %s", e, exc_info=True)
             raise SystemExit("Falha na geração dos artigos")
 
         logging.info("Pipeline de processamento concluído com sucesso")
 
     except Exception as e:
-        logging.error(f"Erro não esperado: {str(e)}", exc_info=True)
+        logging.error("Erro não esperado: %s", e, exc_info=True)
         raise SystemExit(f"Erro não esperado: {str(e)}")
 
 
@@ -1084,11 +1857,11 @@ if __name__ == "__main__":
     try:
         run()
     except SystemExit as e:
-        logging.critical(f"Execução interrompida: {e}")
+        logging.critical("Execução interrompida: %s", e)
         sys.exit(1)
     except KeyboardInterrupt:
         logging.info("Execução interrompida pelo usuário")
         sys.exit(0)
     except Exception as e:
-        logging.critical(f"Erro fatal não esperado: {e}", exc_info=True)
+        logging.critical("Erro fatal não esperado: %s", e, exc_info=True)
         sys.exit(1)
@@ -0,0 +1,189 @@
+"""
+Adaptador de LLM com suporte a cache de prompt nativo dos provedores.
+
+Os agentes da equipe enviam, a cada chamada ao modelo, uma mensagem de sistema
+com role, goal e backstory que não muda ao longo da sessão. Este módulo marca
+esse bloco estático para que o provedor o armazene em cache:
+
+- Anthropic: o bloco de sistema recebe `cache_control: {"type": "ephemeral"}`.
+  Fragmentos estáticos registrados (ex.: o template YAML delimitado por
+  `<template>...</template>`) viram blocos próprios, cada um com seu ponto de
+  cache, para que o prefixo até o fim do fragmento seja reaproveitado mesmo
+  quando o conteúdo seguinte varia.
+- OpenAI: é enviado um `prompt_cache_key` derivado do hash do bloco estático,
+  agrupando as requisições que compartilham o mesmo prefixo.
+
+Para os demais provedores as mensagens são repassadas sem alteração.
+"""
+import hashlib
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+
+from crewai import LLM
+
+# Limite de pontos de cache (cache_control) aceitos pela Anthropic por requisição
+MAX_PONTOS_CACHE = 4
+
+# Parâmetros acrescentados apenas à chamada em andamento, como (instância, parâmetros).
+# Cada thread tem seu próprio valor, então chamadas concorrentes ao mesmo LLM não se misturam
+_KWARGS_CHAMADA: ContextVar[Optional[Tuple['PromptCacheLLM', Dict[str, Any]]]] = ContextVar(
+    '_KWARGS_CHAMADA', default=None
+)
+
+
+class PromptCacheLLM(LLM):
+    """
+    LLM que marca o prefixo estático (mensagem de sistema) para cache no provedor.
+
+    Os handles de cache ficam registrados na própria instância, de modo que todos os
+    agentes que compartilham este LLM compartilham também o mesmo ciclo de vida do cache.
+    """
+
+    def __init__(self, model: str, cache_ttl: int = 300, **kwargs):
+        """
+        Inicializa o adaptador.
+
+        Args:
+            model (str): Nome do modelo no formato aceito pelo LiteLLM.
+            cache_ttl (int, opcional): Tempo de vida, em segundos, de cada entrada de cache.
+                Padrão: 300 (TTL do cache efêmero da Anthropic).
+            **kwargs: Parâmetros repassados ao construtor de crewai.LLM.
+        """
+        super().__init__(model=model, **kwargs)
+        self.cache_ttl = cache_ttl
+        self.cache_handles: Dict[str, float] = {}
+        self.delimitadores_fragmentos: Dict[str, str] = {}
+
+    @property
+    def kwargs(self) -> Dict[str, Any]:
+        """Parâmetros extras do construtor, mais os da chamada em andamento (ver call)."""
+        chamada = _KWARGS_CHAMADA.get()
+        if chamada is not None and chamada[0] is self:
+            return {**self._kwargs, **chamada[1]}
+        return self._kwargs
+
+    @kwargs.setter
+    def kwargs(self, valor: Dict[str, Any]) -> None:
+        self._kwargs = valor
+
+    def registrar_fragmentos(self, fragmentos: Dict[str, str]) -> None:
+        """
+        Registra fragmentos estáticos do prompt que devem receber ponto de cache próprio.
+
+        Args:
+            fragmentos (dict): Mapeia o nome do fragmento para o delimitador que marca seu
+                fim na mensagem de sistema (ex.: {'template': '</template>'}).
+        """
+        self.delimitadores_fragmentos.update(fragmentos)
+
+    def _provedor(self) -> str:
+        """Identifica o provedor a partir do nome do modelo."""
+        model = (self.model or '').lower()
+        if model.startswith('anthropic/') or 'claude' in model:
+            return 'anthropic'
+        if model.startswith(('openai/', 'gpt-', 'o1')):
+            return 'openai'
+        return 'outro'
+
+    def _registrar_handle(self, conteudo: str) -> str:
+        """
+        Registra o bloco estático e retorna sua chave de cache.
+
+        A chave é o sha256 do conteúdo; o registro guarda o instante de expiração
+        estimado para indicar, nos logs, se a chamada deve gerar escrita ou leitura.
+        """
+        chave = hashlib.sha256(conteudo.encode('utf-8')).hexdigest()
+        agora = time.monotonic()
+        expira_em = self.cache_handles.get(chave)
+
+        if expira_em is None or expira_em < agora:
+            logging.debug("Cache de prompt: escrita para o prefixo %s", chave[:12])
+        else:
+            logging.debug("Cache de prompt: leitura para o prefixo %s", chave[:12])
+
+        # Cada acesso renova o TTL no provedor
+        self.cache_handles[chave] = agora + self.cache_ttl
+        return chave
+
+    def _dividir_em_blocos(self, conteudo: str) -> List[str]:
+        """
+        Divide o conteúdo ao final de cada fragmento estático registrado.
+
+        Args:
+            conteudo (str): Texto da mensagem de sistema.
+
+        Returns:
+            list: Blocos de texto consecutivos cuja concatenação é o conteúdo original.
+        """
+        cortes = sorted({
+            conteudo.find(delimitador) + len(delimitador)
+            for delimitador in self.delimitadores_fragmentos.values()
+            if delimitador in conteudo
+        })
+
+        blocos = []
+        inicio = 0
+        for corte in cortes + [len(conteudo)]:
+            if corte > inicio:
+                blocos.append(conteudo[inicio:corte])
+                inicio = corte
+        return blocos
+
+    def _marcar_prefixo_estatico(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Converte a mensagem de sistema em um bloco marcado para cache (Anthropic).
+
+        Args:
+            messages (list): Mensagens no formato da API de chat.
+
+        Returns:
+            list: Nova lista de mensagens, sem alterar a original.
+        """
+        marcadas = []
+        for message in messages:
+            if message.get('role') == 'system' and isinstance(message.get('content'), str):
+                self._registrar_handle(message['content'])
+                blocos = self._dividir_em_blocos(message['content'])
+                primeiro_marcado = max(0, len(blocos) - MAX_PONTOS_CACHE)
+                message = {
+                    **message,
+                    'content': [
+                        {'type': 'text', 'text': bloco, 'cache_control': {'type': 'ephemeral'}}
+                        if indice >= primeiro_marcado else {'type': 'text', 'text': bloco}
+                        for indice, bloco in enumerate(blocos)
+                    ]
+                }
+            marcadas.append(message)
+        return marcadas
+
+    def call(self, messages: List[Dict[str, str]], callbacks: List[Any] = []) -> str:
+        """
+        Executa a chamada ao modelo com o prefixo estático marcado para cache.
+
+        Args:
+            messages (list): Mensagens no formato da API de chat.
+            callbacks (list, opcional): Callbacks do LiteLLM.
+
+        Returns:
+            str: Conteúdo da resposta do modelo.
+        """
+        provedor = self._provedor()
+
+        if provedor == 'anthropic':
+            return super().call(self._marcar_prefixo_estatico(messages), callbacks)
+
+        if provedor == 'openai':
+            sistema = next((m['content'] for m in messages
+                            if m.get('role') == 'system' and isinstance(m.get('content'), str)), None)
+            if sistema:
+                # A chave vale só para esta chamada: self.kwargs é compartilhado pelos
+                # agentes e não é alterado
+                token = _KWARGS_CHAMADA.set((self, {'prompt_cache_key': self._registrar_handle(sistema)}))
+                try:
+                    return super().call(messages, callbacks)
+                finally:
+                    _KWARGS_CHAMADA.reset(token)
+
+        return super().call(messages, callbacks)
@@ -0,0 +1,185 @@
+"""
+Caches persistentes de respostas do LLM e de resultados de ferramentas.
+
+Reexecuções do pipeline sobre o mesmo PDF (desenvolvimento, novas tentativas,
+comparações entre versões) repetem chamadas idênticas ao modelo. Este módulo
+armazena as respostas em um banco SQLite local, indexadas pelo hash da
+requisição normalizada, e devolve a resposta armazenada sem chamar o provedor.
+
+A chave inclui o modelo, a temperatura e todas as mensagens enviadas. Como a
+mensagem de sistema contém role, goal e backstory do agente, qualquer alteração
+no agents.yaml invalida automaticamente as entradas anteriores.
+
+O SQLiteCacheHandler substitui o cache de ferramentas em memória do CrewAI
+(`cache=True`) por um banco SQLite em modo WAL, compartilhado entre processos.
+"""
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from crewai.agents.cache import CacheHandler
+
+from revisor_artigos_sl3v1.prompt_cache import PromptCacheLLM
+
+# Espaços e tabulações no fim de cada linha, descartados na chave do cache. Indentação e
+# quebras de linha são mantidas: no YAML dos prompts elas fazem parte da estrutura
+_ESPACOS_FINAIS_RE = re.compile(r'[ \t]+(?=\r?$)', re.MULTILINE)
+
+# Serialização da requisição para a chave do cache: orjson quando disponível. As duas
+# implementações geram o mesmo JSON compacto com chaves ordenadas, então a chave não
+# depende de o orjson estar instalado.
+try:
+    import orjson
+
+    def _serializar_requisicao(obj) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    def _serializar_requisicao(obj) -> bytes:
+        return json.dumps(
+            obj, ensure_ascii=False, sort_keys=True, separators=(',', ':'), default=str
+        ).encode('utf-8')
+
+
+class CachedLLM(PromptCacheLLM):
+    """
+    LLM com cache de respostas em disco, sobre o cache de prompt do provedor.
+    """
+
+    def __init__(self, model: str, cache_dir: Optional[Path] = None, **kwargs):
+        """
+        Inicializa o LLM com cache de respostas.
+
+        Args:
+            model (str): Nome do modelo no formato aceito pelo LiteLLM.
+            cache_dir (Path, opcional): Diretório do banco de cache. Se None,
+                o cache de respostas fica desativado.
+            **kwargs: Parâmetros repassados a PromptCacheLLM.
+        """
+        super().__init__(model=model, **kwargs)
+        self.cache_path = None
+
+        if cache_dir is not None:
+            cache_dir = Path(cache_dir)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            self.cache_path = cache_dir / 'respostas_llm.sqlite3'
+            with self._conectar() as conexao:
+                # WAL: os workers do pool de PDFs leem o cache enquanto outro grava
+                conexao.execute("PRAGMA journal_mode=WAL")
+                conexao.execute(
+                    "CREATE TABLE IF NOT EXISTS respostas (chave TEXT PRIMARY KEY, resposta TEXT NOT NULL)"
+                )
+
+    @contextmanager
+    def _conectar(self):
+        """Abre uma conexão por operação, permitindo uso a partir de várias threads."""
+        conexao = sqlite3.connect(self.cache_path, timeout=30)
+        try:
+            conexao.execute("PRAGMA synchronous=NORMAL")
+            with conexao:
+                yield conexao
+        finally:
+            conexao.close()
+
+    def _chave(self, messages: List[Dict[str, Any]]) -> str:
+        """
+        Calcula a chave do cache para a requisição.
+
+        Apenas os espaços no fim de cada linha são descartados: colapsar todo espaço em
+        branco faria YAMLs com indentação (e portanto estrutura) diferente colidirem.
+        """
+        normalizadas = [
+            {**m, 'content': _ESPACOS_FINAIS_RE.sub('', m['content'])}
+            if isinstance(m.get('content'), str) else m
+            for m in messages
+        ]
+        payload = _serializar_requisicao([self.model, self.temperature, normalizadas])
+        return hashlib.sha256(payload).hexdigest()
+
+    def call(self, messages: List[Dict[str, str]], callbacks: List[Any] = []) -> str:
+        """
+        Retorna a resposta armazenada ou executa a chamada e armazena o resultado.
+
+        Args:
+            messages (list): Mensagens no formato da API de chat.
+            callbacks (list, opcional): Callbacks do LiteLLM.
+
+        Returns:
+            str: Conteúdo da resposta do modelo.
+        """
+        if self.cache_path is None:
+            return super().call(messages, callbacks)
+
+        chave = self._chave(messages)
+
+        with self._conectar() as conexao:
+            linha = conexao.execute("SELECT resposta FROM respostas WHERE chave = ?", (chave,)).fetchone()
+        if linha is not None:
+            logging.info("Resposta do LLM obtida do cache: %s", chave[:12])
+            return linha[0]
+
+        resposta = super().call(messages, callbacks)
+
+        if resposta:
+            with self._conectar() as conexao:
+                conexao.execute(
+                    "INSERT OR REPLACE INTO respostas (chave, resposta) VALUES (?, ?)", (chave, resposta)
+                )
+
+        return resposta
+
+
+class SQLiteCacheHandler(CacheHandler):
+    """
+    Cache de resultados de ferramentas compartilhado entre processos.
+
+    Implementa o mesmo protocolo do CacheHandler do CrewAI (add/read). As entradas
+    são separadas por `namespace` (um por documento), pois ferramentas como o
+    PDFSearchTool têm o mesmo nome para PDFs diferentes e a mesma consulta não
+    pode devolver trechos de outro arquivo.
+    """
+
+    path: str
+    namespace: str = ''
+
+    def model_post_init(self, __context: Any) -> None:
+        super().model_post_init(__context)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        with self._conectar() as conexao:
+            conexao.execute("PRAGMA journal_mode=WAL")
+            conexao.execute(
+                "CREATE TABLE IF NOT EXISTS ferramentas (chave TEXT PRIMARY KEY, resultado TEXT NOT NULL)"
+            )
+
+    @contextmanager
+    def _conectar(self):
+        """Abre uma conexão por operação, permitindo uso a partir de várias threads."""
+        conexao = sqlite3.connect(self.path, timeout=30)
+        try:
+            conexao.execute("PRAGMA synchronous=NORMAL")
+            with conexao:
+                yield conexao
+        finally:
+            conexao.close()
+
+    def _chave(self, tool, input) -> str:
+        payload = f"{self.namespace}|{tool}|{input}"
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def add(self, tool, input, output):
+        with self._conectar() as conexao:
+            conexao.execute(
+                "INSERT OR REPLACE INTO ferramentas (chave, resultado) VALUES (?, ?)",
+                (self._chave(tool, input), str(output))
+            )
+
+    def read(self, tool, input) -> Optional[str]:
+        with self._conectar() as conexao:
+            linha = conexao.execute(
+                "SELECT resultado FROM ferramentas WHERE chave = ?", (self._chave(tool, input),)
+            ).fetchone()
+        return linha[0] if linha else None
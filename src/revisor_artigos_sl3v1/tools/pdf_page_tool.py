@@ -0,0 +1,73 @@
+from typing import Iterator, Optional, Tuple, Type
+
+from crewai_tools import BaseTool
+from pydantic import BaseModel, Field
+from pypdf import PdfReader
+
+
+class PDFPageReaderToolSchema(BaseModel):
+    """Entrada para PDFPageReaderTool."""
+
+    pagina_inicial: int = Field(1, description="Primeira página a ser lida (começando em 1)")
+    pagina_final: Optional[int] = Field(
+        None, description="Última página a ser lida. Se omitida, lê o lote máximo a partir da inicial"
+    )
+
+
+class PDFPageReaderTool(BaseTool):
+    """
+    Lê o texto de um PDF por intervalos de páginas.
+
+    Diferente do PDFSearchTool, que devolve trechos por busca semântica, esta ferramenta
+    permite ao agente percorrer o documento em lotes de páginas. O arquivo é lido sob
+    demanda, página a página, e páginas sem texto extraível (ex.: apenas imagens) são
+    ignoradas sem custo de processamento adicional.
+    """
+
+    name: str = "Ler páginas de um PDF"
+    description: str = (
+        "Lê o texto de um intervalo de páginas do PDF. Use intervalos sucessivos "
+        "(ex.: 1-10, 11-20) para percorrer documentos extensos."
+    )
+    args_schema: Type[BaseModel] = PDFPageReaderToolSchema
+    pdf: str
+    max_pages_per_batch: int = 10
+
+    def iter_pages(self, inicio: int = 1, fim: Optional[int] = None,
+                   skip_image_only: bool = True) -> Iterator[Tuple[int, str]]:
+        """
+        Gera (número da página, texto) para o intervalo solicitado.
+
+        O arquivo permanece aberto durante a iteração e cada página só é
+        decodificada quando consumida.
+        """
+        with open(self.pdf, 'rb') as file:
+            reader = PdfReader(file)
+            total = len(reader.pages)
+            fim = min(fim or total, total)
+
+            for numero in range(max(inicio, 1), fim + 1):
+                texto = reader.pages[numero - 1].extract_text() or ''
+                if skip_image_only and not texto.strip():
+                    continue
+                yield numero, texto
+
+    def tem_texto(self, paginas: int = 2, minimo: int = 50) -> bool:
+        """
+        Indica se alguma das primeiras páginas tem texto extraível.
+
+        PDFs digitalizados (apenas imagens) não produzem texto; detectá-los lendo só
+        as primeiras páginas evita indexar e enviar ao modelo um documento vazio.
+        """
+        return any(len(texto.strip()) >= minimo for _, texto in self.iter_pages(1, paginas))
+
+    def _run(self, pagina_inicial: int = 1, pagina_final: Optional[int] = None) -> str:
+        limite = pagina_inicial + self.max_pages_per_batch - 1
+        pagina_final = min(pagina_final or limite, limite)
+
+        partes = [f"--- Página {numero} ---\n{texto}"
+                  for numero, texto in self.iter_pages(pagina_inicial, pagina_final)]
+
+        if not partes:
+            return f"Nenhum texto encontrado entre as páginas {pagina_inicial} e {pagina_final}."
+        return '\n'.join(partes)
@@ -0,0 +1,72 @@
+"""
+Testes da montagem da equipe (revisor_artigos_sl3v1.crew) com as configurações do projeto.
+"""
+from pathlib import Path
+
+import pytest
+
+crewai = pytest.importorskip('crewai')
+yaml = pytest.importorskip('yaml')
+
+from langchain_core.tools import StructuredTool  # noqa: E402
+
+from revisor_artigos_sl3v1.crew import RevisorArtigosSl3V1Crew  # noqa: E402
+from revisor_artigos_sl3v1.response_cache import SQLiteCacheHandler  # noqa: E402
+
+CONFIG_DIR = Path(__file__).resolve().parent.parent / 'src' / 'revisor_artigos_sl3v1' / 'config'
+
+
+@pytest.fixture
+def configs(monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY', 'teste')
+    return tuple(
+        yaml.safe_load((CONFIG_DIR / nome).read_text(encoding='utf-8')) for nome in ('agents.yaml', 'tasks.yaml')
+    )
+
+
+def test_create_crew_usa_cache_persistente_nos_agentes(configs, tmp_path):
+    agents_config, tasks_config = configs
+    instancia = RevisorArtigosSl3V1Crew(
+        agents_config, tasks_config, llm=crewai.LLM(model='gpt-4o-mini'),
+        tool_cache_path=tmp_path / 'ferramentas.sqlite3'
+    )
+
+    crew = instancia.create_crew('artigo.md', cache_namespace='hash-do-pdf')
+
+    handlers = {id(agent.cache_handler): agent.cache_handler for agent in crew.agents}
+    assert len(handlers) == 1
+    (handler,) = handlers.values()
+    assert isinstance(handler, SQLiteCacheHandler)
+    assert handler.namespace == 'hash-do-pdf'
+    assert all(agent.tools_handler.cache is handler for agent in crew.agents)
+
+
+def _ferramenta(nome):
+    return StructuredTool.from_function(func=lambda consulta: '', name=nome, description=f'Ferramenta {nome}')
+
+
+def _nomes(agente):
+    return [tool.name for tool in agente.tools]
+
+
+def test_rebind_pdf_troca_so_as_ferramentas_do_leitor(configs):
+    agents_config, tasks_config = configs
+    instancia = RevisorArtigosSl3V1Crew(
+        agents_config, tasks_config, llm=crewai.LLM(model='gpt-4o-mini'), pdf_tool=_ferramenta('pdf_antigo'),
+        pdf_page_tool=_ferramenta('paginas_antigo'), serper_tool=_ferramenta('serper')
+    )
+    leitor = instancia.leitor
+    outros = ('revisor', 'agente_pesquisa', 'criador_artigos')
+    ferramentas_outros = {nome: _nomes(getattr(instancia, nome)) for nome in outros}
+
+    instancia.rebind_pdf(_ferramenta('pdf_novo'), _ferramenta('paginas_novo'))
+
+    assert instancia.leitor is leitor
+    assert _nomes(leitor) == ['pdf_novo', 'paginas_novo']
+    assert ferramentas_outros['agente_pesquisa'] == ['serper']
+    assert {nome: _nomes(getattr(instancia, nome)) for nome in outros} == ferramentas_outros
+
+    # Um Leitor criado depois da troca também recebe as novas ferramentas
+    instancia.rebind_pdf(_ferramenta('pdf_outro'))
+    del instancia.leitor
+    assert _nomes(instancia.leitor) == ['pdf_outro']
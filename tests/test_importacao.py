@@ -0,0 +1,18 @@
+"""
+Teste de fumaça: o ponto de entrada do CLI (revisor_artigos_sl3v1.main:run) precisa ser importável.
+"""
+import importlib
+
+import pytest
+
+
+def test_main_importavel(monkeypatch):
+    pytest.importorskip('dotenv')
+    pytest.importorskip('yaml')
+    monkeypatch.setenv('OPENAI_API_KEY', 'teste')
+
+    main = importlib.import_module('revisor_artigos_sl3v1.main')
+
+    assert callable(main.run)
+    assert main.eh_artigo_yaml({'ARTIGO': []})
+    assert not main.eh_artigo_yaml(['ARTIGO'])
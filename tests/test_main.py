@@ -0,0 +1,210 @@
+"""
+Testes das funções auxiliares de revisor_artigos_sl3v1.main que não dependem do CrewAI.
+"""
+import importlib
+import json
+import os
+import stat
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('dotenv')
+pytest.importorskip('yaml')
+
+
+@pytest.fixture
+def main(monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY', 'teste')
+    return importlib.import_module('revisor_artigos_sl3v1.main')
+
+
+@pytest.mark.parametrize('valor, esperado', [(None, 8), ('3', 3), ('0', 1), ('muitos', 8)])
+def test_max_workers_pdfs(main, monkeypatch, valor, esperado):
+    if valor is None:
+        monkeypatch.delenv('CREW_CONCURRENCY', raising=False)
+    else:
+        monkeypatch.setenv('CREW_CONCURRENCY', valor)
+
+    assert main._max_workers_pdfs() == esperado
+
+
+def test_arquivo_atomico_respeita_umask_e_permissoes_do_destino(main, tmp_path):
+    umask = os.umask(0o027)
+    try:
+        novo = tmp_path / 'novo.txt'
+        main.escrever_arquivo_atomico(novo, 'a')
+        assert stat.S_IMODE(novo.stat().st_mode) == 0o640
+
+        existente = tmp_path / 'existente.txt'
+        existente.write_text('antigo')
+        existente.chmod(0o604)
+        main.escrever_arquivo_atomico(existente, 'novo')
+        assert stat.S_IMODE(existente.stat().st_mode) == 0o604
+        assert existente.read_text() == 'novo'
+    finally:
+        os.umask(umask)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['existente.txt', 'novo.txt']
+
+
+def test_setup_directories_cria_diretorios_de_saida(main, monkeypatch, tmp_path):
+    saidas = (tmp_path / 'artigos_markdown', tmp_path / 'cache' / 'yamls')
+    monkeypatch.setattr(main, 'DIRETORIOS_SAIDA', saidas)
+    monkeypatch.setattr(main, 'verificar_estrutura_diretorios', lambda: None)
+
+    main.setup_directories()
+
+    assert all(diretorio.is_dir() for diretorio in saidas)
+
+
+def test_generate_linkedin_article_une_itens_de_uma_chave(main):
+    dados = {'ARTIGO': [{'GAP': 'lacuna'}, {'RESULTADOS': 'achados'}, {'TITULO': 'ignorado'}]}
+
+    artigo = main.generate_linkedin_article(dados, 'exemplo.pdf', {})
+
+    assert artigo.startswith(main.CABECALHO_ARTIGO.format(pdf_file_name='exemplo.pdf'))
+    assert artigo.endswith(main.RODAPE_ARTIGO)
+    assert '## 🎯 Por que isso importa?\n\nlacuna' in artigo
+    assert '## 📊 O que encontramos?\n\nachados' in artigo
+    assert artigo.index('lacuna') < artigo.index('achados')
+    assert 'ignorado' not in artigo
+
+
+def test_generate_linkedin_article_aceita_item_unico(main):
+    dados = {'ARTIGO': [{'GAP': 'lacuna', 'FUTURO': 'próximos passos'}]}
+
+    artigo = main.generate_linkedin_article(dados, 'exemplo.pdf', {})
+
+    assert '\n\nlacuna\n\n' in artigo
+    assert '\n\npróximos passos\n\n' in artigo
+
+
+@pytest.mark.parametrize('dados', [None, {}, {'ARTIGO': None}, {'ARTIGO': []}, {'ARTIGO': ['texto']},
+                                   ['ARTIGO']])
+def test_generate_linkedin_article_sem_secoes(main, dados):
+    assert main.generate_linkedin_article(dados, 'exemplo.pdf', {}) is None
+
+
+@pytest.fixture
+def diretorios(main, monkeypatch, tmp_path):
+    """Redireciona os diretórios de YAMLs, artigos e cache do módulo para tmp_path."""
+    yaml_dir = tmp_path / 'yamls'
+    artigos_dir = tmp_path / 'artigos_markdown'
+    for diretorio in (yaml_dir, artigos_dir):
+        diretorio.mkdir()
+    monkeypatch.setattr(main, 'ARTIGOS_MARKDOWN_DIR', artigos_dir)
+    monkeypatch.setattr(main, 'CACHE_DIR', tmp_path / 'cache')
+    monkeypatch.setattr(main, 'MANIFESTO_ARTIGOS', tmp_path / 'artigos.json')
+    monkeypatch.setattr(main, 'verificar_estrutura_diretorios', lambda: (tmp_path / 'pdfs', yaml_dir, tmp_path))
+    main.caminho_artigo.cache_clear()
+    yield yaml_dir, artigos_dir
+    main.caminho_artigo.cache_clear()
+
+
+def test_gerar_artigos_usa_manifesto(main, monkeypatch, diretorios):
+    yaml_dir, artigos_dir = diretorios
+    yaml_file = yaml_dir / 'output_exemplo.yaml'
+    yaml_file.write_text('ARTIGO:\n  - GAP: lacuna\n', encoding='utf-8')
+    artigo = artigos_dir / 'output_exemplo.md'
+
+    gerados = []
+    gerar = main.gerar_artigo_de_dados
+    monkeypatch.setattr(main, 'gerar_artigo_de_dados', lambda *args: gerados.append(args[1]) or gerar(*args))
+
+    main.gerar_artigos_a_partir_de_yaml()
+    assert gerados == ['output_exemplo']
+    assert 'lacuna' in artigo.read_text(encoding='utf-8')
+    assert json.loads(main.MANIFESTO_ARTIGOS.read_text()) == {
+        'output_exemplo.yaml': main.calcular_hash_arquivo(yaml_file)
+    }
+
+    # YAML regravado com o mesmo conteúdo: mais recente que o artigo, mas o hash não mudou
+    mtime_artigo = artigo.stat().st_mtime_ns
+    os.utime(yaml_file, ns=(mtime_artigo + 10**9, mtime_artigo + 10**9))
+    main.gerar_artigos_a_partir_de_yaml()
+    assert gerados == ['output_exemplo']
+
+    # Artigo removido: é regenerado mesmo com o hash registrado
+    artigo.unlink()
+    main.gerar_artigos_a_partir_de_yaml()
+    assert gerados == ['output_exemplo', 'output_exemplo']
+    assert artigo.exists()
+
+
+def test_pdf_concluido_depende_do_artigo_e_nao_do_yaml(main, diretorios, tmp_path):
+    yaml_dir, artigos_dir = diretorios
+    pdf = tmp_path / 'exemplo.pdf'
+    pdf.write_bytes(b'%PDF')
+    mtime_pdf = pdf.stat().st_mtime_ns
+
+    # Revisão concluída, mas o pipeline parou antes do artigo
+    yaml_file = yaml_dir / 'output_artigo_exemplo.yaml'
+    yaml_file.write_text('ARTIGO: []\n', encoding='utf-8')
+    os.utime(yaml_file, ns=(mtime_pdf + 10**9, mtime_pdf + 10**9))
+    assert not main._pdf_concluido(pdf)
+
+    artigo = artigos_dir / 'artigo_exemplo.md'
+    artigo.write_text('artigo', encoding='utf-8')
+    os.utime(artigo, ns=(mtime_pdf - 10**9, mtime_pdf - 10**9))
+    assert not main._pdf_concluido(pdf)
+
+    os.utime(artigo, ns=(mtime_pdf + 10**9, mtime_pdf + 10**9))
+    assert main._pdf_concluido(pdf)
+
+
+def test_extrair_yaml_ignora_preambulo_e_cercas(main):
+    resposta = "Segue a análise:\n\n```yaml\nARTIGO:  \n  - GAP: lacuna\n\n  - FUTURO: 'x'\n```\n"
+
+    yaml_content, dados = main.extrair_yaml(resposta)
+
+    assert yaml_content == "ARTIGO:\n  - GAP: lacuna\n  - FUTURO: 'x'"
+    assert dados == {'ARTIGO': [{'GAP': 'lacuna'}, {'FUTURO': 'x'}]}
+    assert main.extrair_yaml_content(resposta) == yaml_content
+
+
+def test_extrair_yaml_marcador_interrompido_por_crases(main):
+    assert main.extrair_yaml("ART`IGO:\n  - GAP: lacuna") == ('ARTIGO:\n  - GAP: lacuna', {'ARTIGO': [{'GAP': 'lacuna'}]})
+
+
+@pytest.mark.parametrize('conteudo', ['', None, 'Sem a seção esperada', 'ARTIGO: [sem fechamento'])
+def test_extrair_yaml_sem_yaml_valido(main, conteudo):
+    assert main.extrair_yaml(conteudo) is None
+
+
+def test_limpar_conteudo_yaml(main):
+    assert main.limpar_conteudo_yaml("```yaml\nARTIGO:\n  \n  - teste: `valor`   \n```\n") == (
+        "ARTIGO:\n  - teste: valor"
+    )
+    assert main.limpar_conteudo_yaml('') == ''
+
+
+def test_limpar_conteudo_markdown(main):
+    assert main.limpar_conteudo_markdown("```markdown\n# Título\n```\n\n\nTexto  \n") == "# Título\nTexto"
+    assert main.limpar_conteudo_markdown(None) == ''
+
+
+def test_sanitize_filename(main):
+    assert main.sanitize_filename('a/b\\c:d*e?f"g<h>i|j\nk.md') == 'a_b_c_d_e_f_g_h_i_j_k.md'
+    assert main.sanitize_filename('artigo_válido-1.md') == 'artigo_válido-1.md'
+
+
+def test_indexar_saidas_por_tarefa(main):
+    leitura = SimpleNamespace(name='leitura_pdfs', agent='Leitor de PDFs')
+    repetida = SimpleNamespace(name='leitura_pdfs', agent='Leitor de PDFs')
+    sem_nome = SimpleNamespace(name=None, agent='Agente de Pesquisa')
+    desconhecida = SimpleNamespace(name=None, agent='Outro agente')
+
+    saidas = main.indexar_saidas_por_tarefa([leitura, repetida, sem_nome, desconhecida])
+
+    assert saidas == {'leitura_pdfs': leitura, 'pesquisa_informacoes': sem_nome}
+
+
+def test_escrever_arquivo_atomico_substitui_conteudo(main, tmp_path):
+    destino = tmp_path / 'artigo.md'
+    destino.write_text('antigo', encoding='utf-8')
+
+    main.escrever_arquivo_atomico(destino, '# Ciência\n\nação 🔬\n')
+
+    assert destino.read_bytes() == '# Ciência\n\nação 🔬\n'.encode('utf-8')
+    assert [p.name for p in tmp_path.iterdir()] == ['artigo.md']
@@ -0,0 +1,22 @@
+"""
+Testes do adaptador de cache de prompt (revisor_artigos_sl3v1.prompt_cache).
+"""
+import pytest
+
+crewai = pytest.importorskip('crewai')
+
+from revisor_artigos_sl3v1.prompt_cache import PromptCacheLLM  # noqa: E402
+
+
+def test_prompt_cache_key_apenas_na_chamada(monkeypatch):
+    recebidos = []
+    monkeypatch.setattr(crewai.LLM, 'call', lambda self, messages, callbacks=[]: recebidos.append(self.kwargs))
+    llm = PromptCacheLLM(model='gpt-4o-mini', metadata={'pdf': 'exemplo'})
+    kwargs_originais = dict(llm._kwargs)
+
+    llm.call([{'role': 'system', 'content': 'sistema'}, {'role': 'user', 'content': 'oi'}])
+
+    assert recebidos[0]['metadata'] == {'pdf': 'exemplo'}
+    assert len(recebidos[0]['prompt_cache_key']) == 64
+    assert llm._kwargs == kwargs_originais
+    assert 'prompt_cache_key' not in llm.kwargs
@@ -0,0 +1,37 @@
+"""
+Testes da chave do cache de respostas do LLM (revisor_artigos_sl3v1.response_cache).
+"""
+import json
+
+import pytest
+
+pytest.importorskip('crewai')
+
+from revisor_artigos_sl3v1 import response_cache  # noqa: E402
+
+
+@pytest.fixture
+def llm():
+    return response_cache.CachedLLM(model='gpt-4o-mini', temperature=0)
+
+
+def _mensagens(conteudo):
+    return [{'role': 'system', 'content': 'sistema'}, {'role': 'user', 'content': conteudo}]
+
+
+def test_chave_ignora_espacos_no_fim_das_linhas(llm):
+    assert llm._chave(_mensagens('ARTIGO:\n  - GAP: x\n')) == llm._chave(_mensagens('ARTIGO:  \n  - GAP: x\t\n'))
+    assert llm._chave(_mensagens('linha\r\n')) == llm._chave(_mensagens('linha \r\n'))
+
+
+def test_chave_distingue_indentacao(llm):
+    assert llm._chave(_mensagens('a:\n  b: 1\n')) != llm._chave(_mensagens('a:\nb: 1\n'))
+    assert llm._chave(_mensagens('a:\n  b: 1\n')) != llm._chave(_mensagens('a:\n    b: 1\n'))
+
+
+def test_serializacao_igual_ao_json_padrao():
+    obj = ['gpt-4o-mini', 0.2, [{'role': 'user', 'content': 'ação "x"\n\tb', 'z': None, 'a': [1, True]}]]
+
+    esperado = json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+    assert response_cache._serializar_requisicao(obj) == esperado